@@ -1,3 +1,3 @@
-from .config import settings
+from .config import get_settings, settings
 
-__all__ = ["settings"]
+__all__ = ["get_settings", "settings"]
@@ -4,6 +4,8 @@ RFC 3164/5424 Syslog 파서 애플리케이션의 설정 정보입니다.
 이 모듈은 Pydantic의 BaseSettings를 사용하여 애플리케이션 설정을 정의하고,
 기본값과 환경 변수 지원을 제공합니다.
 """
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -18,6 +20,7 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8001
     debug: bool = False
+    sender_max_concurrency: int = 64
 
     class Config:
         """환경 변수를 .env 파일에서 로드하기 위한 구성 클래스입니다.
@@ -25,4 +28,16 @@ class Settings(BaseSettings):
         env_file = ".env"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """애플리케이션 설정 인스턴스를 반환합니다.
+
+    .env 파일은 최초 호출 시 한 번만 읽고, 이후 호출은 캐시된 인스턴스를 반환합니다.
+
+    Returns:
+        Settings: 애플리케이션 설정
+    """
+    return Settings()
+
+
+settings = get_settings()
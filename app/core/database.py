@@ -3,29 +3,92 @@
 이 모듈은 ExampleDatabase 클래스를 제공하여 사용자 정의 예제에 대한 모든 데이터베이스 작업을 처리합니다.
 데이터베이스는 SQLAlchemy ORM과 SQLite를 사용하며, 예제의 이름, 설명, RFC 버전 및 원시 메시지 내용과 같은 메타데이터를 저장합니다.
 """
-from datetime import datetime
-from sqlite3 import DataError, IntegrityError, OperationalError, ProgrammingError
+from datetime import datetime, timedelta
+import sqlite3
 from typing import List, Optional
-from sqlalchemy import create_engine, Integer, String, DateTime
-from sqlalchemy.orm import declarative_base, sessionmaker, Session, Mapped, mapped_column
-from app.models.example import CustomExample
+from sqlalchemy import (create_engine, delete, event, insert, select, text, update,
+                        Index, Integer, String)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import (declarative_base, sessionmaker, scoped_session, Session,
+                            Mapped, mapped_column)
+from app.models.example import CreateExampleRequest, CustomExample
 
 
 Base = declarative_base()
 
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+"""새 SQLite 연결마다 적용할 PRAGMA 목록 (WAL 저널, 20MB 페이지 캐시, 256MB mmap)"""
+
+PARTIAL_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_examples_5424_created "
+    "ON custom_examples(created_at DESC) WHERE rfc_version='5424'",
+    "CREATE INDEX IF NOT EXISTS idx_examples_3164_created "
+    "ON custom_examples(created_at DESC) WHERE rfc_version='3164'",
+)
+"""RFC 버전별 부분 인덱스 DDL (SQLite 3.8.0 이상에서만 생성)"""
+
+SCHEMA_VERSION = 1
+"""PRAGMA user_version으로 관리하는 스키마 버전 (1: 타임스탬프를 epoch 마이크로초 정수로 저장)"""
+
+TIMESTAMP_MIGRATION = """
+UPDATE custom_examples SET
+    created_at = CAST(strftime('%s', substr(created_at, 1, 19)) AS INTEGER) * 1000000
+        + CAST(substr(substr(created_at, 21) || '000000', 1, 6) AS INTEGER),
+    updated_at = CAST(strftime('%s', substr(updated_at, 1, 19)) AS INTEGER) * 1000000
+        + CAST(substr(substr(updated_at, 21) || '000000', 1, 6) AS INTEGER)
+WHERE created_at LIKE '____-__-__%'
+"""
+"""ISO 문자열로 저장된 기존 타임스탬프를 epoch 마이크로초 정수로 변환하는 SQL"""
+
+
+class EpochMicros(TypeDecorator):
+    """datetime을 epoch 기준 마이크로초 정수로 저장하는 컬럼 타입  
+
+    조회 시 행마다 ISO 문자열을 파싱하지 않고 정수 덧셈으로 datetime을 복원합니다.
+    naive datetime을 그대로 기준 시각(1970-01-01)과의 차이로 저장합니다.
+    """
+    impl = Integer
+    cache_ok = True
+
+    _epoch = datetime(1970, 1, 1)
+    _microsecond = timedelta(microseconds=1)
+
+    def process_bind_param(self, value: Optional[datetime], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return (value - self._epoch) // self._microsecond
+
+    def process_result_value(self, value, dialect) -> Optional[datetime]:
+        if value is None:
+            return None
+        # TEXT 선언 컬럼을 가진 기존 db에서는 정수가 문자열로 반환될 수 있다
+        return self._epoch + timedelta(microseconds=int(value))
+
 
 class CustomExampleModel(Base):
     """커스텀 예시 syslog 모델
     """
     __tablename__ = "custom_examples"
+    __table_args__ = (
+        Index("idx_custom_examples_rfc_created", "rfc_version", "created_at"),
+        Index("idx_custom_examples_created", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str] = mapped_column(String, nullable=True)
     rfc_version: Mapped[str] = mapped_column(String, nullable=False)
     raw_message: Mapped[str] = mapped_column(String, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(EpochMicros, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(EpochMicros, nullable=False)
 
 
 class ExampleDatabase:
@@ -38,34 +101,132 @@ class ExampleDatabase:
     def __init__(self, db_path: str = "examples.db") -> None:
         """초기화  
         db 파일(sqllite) 경로를 설정하고 SQLAlchemy 엔진과 세션을 초기화합니다.
+        연결은 QueuePool에서 재사용되며, 풀링된 연결이 생성될 때마다 SQLITE_PRAGMAS가 적용됩니다.
+        세션은 스레드 단위 scoped_session으로 관리되며, 쓰기 작업용 세션은
+        BEGIN IMMEDIATE로 트랜잭션을 시작하는 write_engine에 바인딩됩니다.
 
         Args:
             db_path (str, optional): db 파일 경로. Defaults to "examples.db".
         """
         self.db_url = f"sqlite:///{db_path}"
-        self.engine = create_engine(self.db_url, echo=False)
-        self.session_local = sessionmaker(
-            autocommit=False, autoflush=False, bind=self.engine)
+        self.engine = create_engine(
+            self.db_url,
+            echo=False,
+            connect_args={"check_same_thread": False},
+            pool_size=8,
+            max_overflow=10,
+        )
+        event.listen(self.engine, "connect", self._apply_pragmas)
+        event.listen(self.engine, "begin", self._begin_transaction)
+        self.write_engine = self.engine.execution_options(begin_immediate=True)
+        self.session_local = scoped_session(sessionmaker(
+            autocommit=False, autoflush=False, bind=self.engine))
+        self.write_session_local = scoped_session(sessionmaker(
+            autocommit=False, autoflush=False, bind=self.write_engine))
         self.init_db()
 
+    @staticmethod
+    def _apply_pragmas(dbapi_connection, _connection_record) -> None:
+        """SQLite 연결 PRAGMA 설정  
+
+        새 DBAPI 연결이 풀에 추가될 때 호출되어 SQLITE_PRAGMAS를 실행합니다.
+        PRAGMA는 연결 단위로 유지되므로 풀링된 연결에서는 한 번만 적용됩니다.
+
+        pysqlite의 암묵적 BEGIN은 끄고 트랜잭션 시작은 _begin_transaction에서 직접 처리합니다.
+
+        Args:
+            dbapi_connection: sqlite3 DBAPI 연결 객체
+            _connection_record: SQLAlchemy 연결 레코드 (사용하지 않음)
+        """
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _begin_transaction(conn) -> None:
+        """트랜잭션 시작 문 발행  
+
+        begin_immediate 실행 옵션이 설정된 연결(쓰기 작업)은 BEGIN IMMEDIATE로
+        예약 잠금을 먼저 획득하여 읽기→쓰기 잠금 승격 중 SQLITE_BUSY를 피합니다.
+        읽기 작업은 WAL 동시 읽기를 유지하도록 일반 BEGIN을 사용합니다.
+
+        Args:
+            conn: SQLAlchemy 연결 객체
+        """
+        if conn.get_execution_options().get("begin_immediate"):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            conn.exec_driver_sql("BEGIN")
+
     def init_db(self) -> None:
         """db 테이블 생성  
         SQLAlchemy를 사용하여 db 테이블을 생성합니다.  
+        create_all은 이미 존재하는 테이블의 인덱스를 만들지 않으므로,
+        기존 db 파일에도 적용되도록 인덱스를 개별적으로 생성합니다.
+        RFC 버전별 부분 인덱스는 지원되는 SQLite 버전에서만 추가합니다.
+        테이블 생성 후 스키마 버전에 따른 마이그레이션을 수행합니다.
         """
         Base.metadata.create_all(bind=self.engine)
+        self._migrate_schema()
+        for index in CustomExampleModel.__table__.indexes:
+            index.create(bind=self.engine, checkfirst=True)
+
+        # 부분 인덱스는 SQLite 3.8.0부터 지원
+        if sqlite3.sqlite_version_info >= (3, 8, 0):
+            with self.engine.begin() as conn:
+                for ddl in PARTIAL_INDEXES:
+                    conn.execute(text(ddl))
+
+    def _migrate_schema(self) -> None:
+        """스키마 마이그레이션  
+
+        PRAGMA user_version이 SCHEMA_VERSION보다 낮으면 ISO 문자열 타임스탬프를
+        epoch 마이크로초 정수로 한 번만 변환하고 버전을 갱신합니다.
+        """
+        with self.engine.begin() as conn:
+            version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+            if version >= SCHEMA_VERSION:
+                return
+            conn.exec_driver_sql(TIMESTAMP_MIGRATION)
+            conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
     def get_session(self) -> Session:
         """데이터베이스 세션 반환 함수  
 
-        이 함수는 데이터베이스와의 연결 세션을 생성하여 반환합니다. 
+        이 함수는 현재 스레드에 바인딩된 데이터베이스 세션을 반환합니다. 
         세션은 데이터베이스 작업을 수행하는 데 필요한 컨텍스트를 제공하며,
         트랜잭션 관리 및 쿼리 실행에 사용됩니다.
+        with 블록 종료 시 세션이 닫히고 연결은 풀로 반환됩니다.
         
         Returns:
-            Session: 생성된 데이터베이스 세션 객체
+            Session: 데이터베이스 세션 객체
         """
         return self.session_local()
 
+    def get_write_session(self) -> Session:
+        """쓰기 작업용 데이터베이스 세션 반환 함수  
+
+        get_session과 같지만 트랜잭션을 BEGIN IMMEDIATE로 시작하는 세션을 반환합니다.
+        생성, 수정, 삭제 작업에서 사용합니다.
+
+        Returns:
+            Session: 쓰기 작업용 데이터베이스 세션 객체
+        """
+        return self.write_session_local()
+
+    def close(self) -> None:
+        """세션 레지스트리와 연결 풀 정리  
+
+        scoped_session 레지스트리를 비우고 풀링된 모든 연결을 닫습니다.
+        """
+        self.session_local.remove()
+        self.write_session_local.remove()
+        self.engine.dispose()
+
     def _model_to_pydantic(self, model: CustomExampleModel) -> CustomExample:
         """모델 객체를 Pydantic 모델로 변환  
         
@@ -100,10 +261,13 @@ class ExampleDatabase:
 
         Returns:
             CustomExample: 생성된 예제 객체
+
+        Raises:
+            ValueError: 무결성 제약 조건 위반 시. 그 외 DB 오류는 그대로 전파됩니다.
         """
         now = datetime.now()
 
-        with self.get_session() as session:
+        with self.get_write_session() as session:
             db_example = CustomExampleModel(
                 name=name,
                 description=description,
@@ -121,25 +285,58 @@ class ExampleDatabase:
                 return self._model_to_pydantic(db_example)
             except IntegrityError as e:
                 session.rollback()
-                raise ValueError(f"중복된 데이터입니다: {str(e)}") from e
-            except DataError as e:
-                session.rollback()
-                raise ValueError(f"데이터 형식 오류: {str(e)}") from e
-            except OperationalError as e:
-                session.rollback()
-                raise ConnectionError(f"데이터베이스 연결 오류: {str(e)}") from e
-            except ProgrammingError as e:
-                session.rollback()
-                raise ValueError(f"SQL 문법 오류: {str(e)}") from e
-            except Exception as e:
+                raise ValueError("중복된 데이터입니다") from e
+
+    def create_examples_bulk(self, examples: List[CreateExampleRequest]) -> List[CustomExample]:
+        """커스텀 예제 일괄 저장  
+
+        여러 예제를 하나의 트랜잭션에서 단일 executemany INSERT로 저장합니다.
+        행마다 커밋하지 않으므로 커밋 비용이 전체 행에 분산됩니다.
+
+        Args:
+            examples (List[CreateExampleRequest]): 저장할 예제 목록
+
+        Returns:
+            List[CustomExample]: 생성된 예제 객체 목록
+
+        Raises:
+            ValueError: 무결성 제약 조건 위반 시. 그 외 DB 오류는 그대로 전파됩니다.
+        """
+        if not examples:
+            return []
+
+        now = datetime.now()
+        rows = [
+            {
+                "name": example.name,
+                "description": example.description,
+                "rfc_version": example.rfc_version,
+                "raw_message": example.raw_message,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for example in examples
+        ]
+
+        with self.get_write_session() as session:
+            try:
+                db_examples = session.scalars(
+                    insert(CustomExampleModel).returning(CustomExampleModel), rows
+                ).all()
+                created = [self._model_to_pydantic(db_example) for db_example in db_examples]
+                session.commit()
+
+                return created
+            except IntegrityError as e:
                 session.rollback()
-                raise RuntimeError(f"예상치 못한 오류 발생: {str(e)}") from e
+                raise ValueError("중복된 데이터입니다") from e
 
     def get_examples(self, rfc_version: Optional[str] = None) -> List[CustomExample]:
         """예제 리턴  
 
         데이터베이스에서 예제 정보를 읽어와 리턴한다.
         rfc_version 값을 전달인자로 받아 필터링한다.
+        ORM 객체를 거치지 않고 Core SELECT 결과 행으로 바로 응답 모델을 구성한다.
 
         Args:
             rfc_version (Optional[str], optional): rfc버전. Defaults to None.
@@ -147,14 +344,22 @@ class ExampleDatabase:
         Returns:
             List[CustomExample]: 예제 리스트
         """
-        with self.get_session() as session:
-            query = session.query(CustomExampleModel)
-
-            if rfc_version:
-                query = query.filter(CustomExampleModel.rfc_version == rfc_version)
+        stmt = select(
+            CustomExampleModel.id,
+            CustomExampleModel.name,
+            CustomExampleModel.description,
+            CustomExampleModel.rfc_version,
+            CustomExampleModel.raw_message,
+            CustomExampleModel.created_at,
+            CustomExampleModel.updated_at,
+        ).order_by(CustomExampleModel.created_at.desc())
+
+        if rfc_version:
+            stmt = stmt.where(CustomExampleModel.rfc_version == rfc_version)
 
-            db_examples = query.order_by(CustomExampleModel.created_at.desc()).all()
-            return [self._model_to_pydantic(example) for example in db_examples]
+        with self.get_session() as session:
+            rows = session.execute(stmt).mappings()
+            return [CustomExample(**row) for row in rows]
 
     def get_example(self, example_id: int) -> Optional[CustomExample]:
         """ID로 예제 조회  
@@ -184,6 +389,7 @@ class ExampleDatabase:
         주어진 예제 ID에 해당하는 데이터를 찾아서, 전달된 파라미터들을 기반으로 필드를 업데이트합니다.
         업데이트 가능한 필드는 이름(name), 설명(description), RFC 버전(rfc_version), 원시 메시지(raw_message)입니다.
         모든 업데이트 후에는 updated_at 타임스탬프가 자동으로 갱신됩니다.
+        조회와 수정을 하나의 UPDATE ... RETURNING 문으로 처리합니다.
         만약 해당 ID의 예제가 존재하지 않으면 None을 반환합니다.
 
         Args:
@@ -196,29 +402,34 @@ class ExampleDatabase:
         Returns:
             Optional[CustomExample]: 업데이트된 예제 모델 인스턴스 또는 존재하지 않으면 None
         """
-        with self.get_session() as session:
-            db_example = session.query(CustomExampleModel).filter(
-                CustomExampleModel.id == example_id
-            ).first()
+        values = {
+            column: value for column, value in (
+                ("name", name),
+                ("description", description),
+                ("rfc_version", rfc_version),
+                ("raw_message", raw_message),
+            ) if value is not None
+        }
+        values["updated_at"] = datetime.now()
+
+        # 조회 없이 단일 UPDATE ... RETURNING 문으로 수정 결과를 받는다 (SQLite >= 3.35)
+        stmt = (
+            update(CustomExampleModel)
+            .where(CustomExampleModel.id == example_id)
+            .values(**values)
+            .returning(CustomExampleModel)
+        )
+
+        with self.get_write_session() as session:
+            db_example = session.scalars(stmt).first()
 
             if not db_example:
                 return None
 
-            if name is not None:
-                db_example.name = name
-            if description is not None:
-                db_example.description = description
-            if rfc_version is not None:
-                db_example.rfc_version = rfc_version
-            if raw_message is not None:
-                db_example.raw_message = raw_message
-
-            db_example.updated_at = datetime.now()
-
+            example = self._model_to_pydantic(db_example)
             session.commit()
-            session.refresh(db_example)
 
-            return self._model_to_pydantic(db_example)
+            return example
 
     def delete_example(self, example_id: int) -> bool:
         """예제를 데이터베이스에서 삭제  
@@ -226,6 +437,7 @@ class ExampleDatabase:
         주어진 ID에 해당하는 예제를 데이터베이스에서 찾아서 삭제합니다. 
         예제가 존재하지 않을 경우 False를 반환하며, 성공적으로 삭제된 경우 True를 반환합니다.
         데이터베이스 세션을 자동으로 관리하고, 삭제 작업 후 커밋합니다.
+        행을 미리 조회하지 않고 단일 DELETE ... RETURNING 문으로 삭제 여부를 확인합니다.
 
         Args:
             example_id (int): 삭제할 예제의 고유 ID
@@ -233,16 +445,16 @@ class ExampleDatabase:
         Returns:
             bool: 예제 삭제 성공 여부. 존재하지 않는 경우 False를 반환합니다.
         """
-        with self.get_session() as session:
-            db_example = session.query(CustomExampleModel).filter(
-                CustomExampleModel.id == example_id
-            ).first()
+        stmt = (
+            delete(CustomExampleModel)
+            .where(CustomExampleModel.id == example_id)
+            .returning(CustomExampleModel.id)
+        )
 
-            if db_example:
-                session.delete(db_example)
-                session.commit()
-                return True
-            return False
+        with self.get_write_session() as session:
+            deleted = session.execute(stmt).first() is not None
+            session.commit()
+            return deleted
 
 
 # Global database instance
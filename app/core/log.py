@@ -0,0 +1,36 @@
+"""
+애플리케이션 로깅 구성 모듈.
+
+요청 처리 코루틴이 터미널/파일 쓰기를 기다리지 않도록 로그 레코드는 QueueHandler로 큐에
+넣기만 하고, 실제 출력은 QueueListener의 백그라운드 스레드가 담당합니다.
+"""
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+def configure_logging(level: int) -> QueueListener:
+    """루트 로거에 큐 기반 핸들러를 설치하고, 출력을 담당할 리스너를 반환합니다.
+
+    리스너는 호출 측에서 start()/stop()으로 수명을 관리합니다. 시작 전에 기록된 로그는
+    큐에 보관되었다가 리스너가 시작되면 출력됩니다. 여러 번 호출해도 루트 로거에는
+    마지막으로 설치한 QueueHandler 하나만 남으므로 로그가 중복 출력되지 않습니다.
+
+    Args:
+        level (int): 루트 로거 수준 (예: logging.INFO)
+
+    Returns:
+        QueueListener: 큐의 레코드를 표준 에러로 출력하는 리스너
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in [h for h in root.handlers if isinstance(h, QueueHandler)]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+
+    return QueueListener(log_queue, stream_handler, respect_handler_level=True)
@@ -1,29 +1,37 @@
 """Syslog Generate Service"""
+import logging
+
 from app.generators import RFC3164MessageGenerator, RFC5424MessageGenerator
 from app.models.syslog import MessageComponents
 
+logger = logging.getLogger(__name__)
+
 rfc3164_generator = RFC3164MessageGenerator()
 """RFC3164MessageGenerator: RFC3164 형식 syslog 메시지를 생성하는 인스턴스"""
 
 rfc5424_generator = RFC5424MessageGenerator()
 """RFC5424MessageGenerator: RFC5424 형식 syslog 메시지를 생성하는 인스턴스"""
 
+GENERATORS = {
+    "3164": rfc3164_generator.generate,
+    "5424": rfc5424_generator.generate,
+}
+"""RFC 버전별 생성 함수 디스패치 테이블"""
+
 
 def generate(rfc_version: str, components: MessageComponents) -> str:
     """RFC 버전에 따라 메시지를 생성합니다.
 
     Args:
         rfc_version (str): 사용할 RFC 버전으로, "5424" 또는 다른 값이 될 수 있습니다.
+            GENERATORS에 없는 값은 RFC 3164로 처리합니다.
         components (MessageComponents): 메시지 생성에 필요한 구성 요소들
 
     Returns:
         str: 생성된 메시지 문자열
     """
-    generated_message: str
-    if rfc_version == "5424":
-        generated_message = rfc5424_generator.generate(components)
-    else:
-        generated_message = rfc3164_generator.generate(components)
+    generated_message = GENERATORS.get(rfc_version, rfc3164_generator.generate)(components)
 
-    print(f"Generated message: {generated_message}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Generated message: %s", generated_message)
     return generated_message
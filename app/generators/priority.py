@@ -0,0 +1,49 @@
+"""
+Syslog 우선순위(PRI) 계산 모듈
+
+facility(0-23)와 severity(0-7) 조합의 우선순위 값을 모듈 로드 시 미리 계산해 두고
+생성기에서 테이블 조회로 사용합니다.
+"""
+
+PRI_TABLE = tuple(
+    tuple((facility << 3) + severity for severity in range(8))
+    for facility in range(24)
+)
+"""facility, severity 순으로 인덱싱하는 우선순위 값 테이블 (24 x 8)"""
+
+
+def generate_priority(facility: int, severity: int) -> int:
+    """facility와 severity 값으로 priority 계산  
+
+    표준 범위의 값은 PRI_TABLE에서 조회하고, 범위를 벗어난 값은 직접 계산합니다.
+
+    Args:
+        facility (int): 시설 코드
+        severity (int): 심각도 코드
+
+    Returns:
+        int: 생성된 우선순위 값
+    """
+    if 0 <= facility < 24 and 0 <= severity < 8:
+        return PRI_TABLE[facility][severity]
+    return (facility << 3) + severity
+
+
+PRI_PREFIXES = tuple(f"<{priority}>" for priority in range(192))
+"""우선순위 값(0-191)별로 미리 만든 "<PRI>" 헤더 문자열"""
+
+
+def priority_prefix(priority: int) -> str:
+    """우선순위 값을 syslog 헤더의 "<PRI>" 문자열로 변환  
+
+    표준 범위(0-191)의 값은 PRI_PREFIXES에서 조회하고, 그 외 값은 직접 포맷합니다.
+
+    Args:
+        priority (int): 우선순위 값
+
+    Returns:
+        str: "<PRI>" 형식의 문자열
+    """
+    if 0 <= priority < 192:
+        return PRI_PREFIXES[priority]
+    return f"<{priority}>"
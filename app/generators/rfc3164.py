@@ -4,14 +4,38 @@ RFC 3164 Syslog 메시지 생성기
 이 모듈은 RFC 3164 표준에 따라 Syslog 메시지를 생성하는 기능을 제공합니다.
 Syslog 메시지는 우선순위, 타임스탬프, 호스트명, 태그, PID 및 메시지 내용으로 구성됩니다.
 """
-import datetime
+import time
+from functools import lru_cache
+from typing import Optional
 from app.models import MessageComponents
+from app.generators.priority import generate_priority, priority_prefix
+
+_timestamp_cache = (-1, "")
+"""마지막으로 생성한 (epoch 초, RFC 3164 타임스탬프 문자열) 캐시"""
+
+
+def _build_message(priority: int, timestamp: str, hostname: str,
+                   tag: str, pid: Optional[int], message: str) -> str:
+    """기본값이 적용된 필드로 RFC 3164 메시지 문자열을 조립합니다."""
+    parts = [priority_prefix(priority), timestamp, " ", hostname, " ", tag]
+    if pid:
+        parts.append(f"[{pid}]")
+    parts.append(": ")
+    parts.append(message)
+    return "".join(parts)
+
+
+_build_message_cached = lru_cache(maxsize=1024)(_build_message)
+"""타임스탬프가 지정된 동일 구성 요소의 반복 생성을 위한 LRU 캐시 버전"""
+
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+"""RFC 3164 월 약어 테이블 (tm_mon - 1 인덱스)"""
 
 
 class RFC3164MessageGenerator:
     """RFC 3164 Syslog 메시지 생성기."""
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-              'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    months = MONTHS
 
     @staticmethod
     def generate_priority(facility: int, severity: int) -> int:
@@ -25,7 +49,7 @@ class RFC3164MessageGenerator:
         Returns:
             int: 생성된 우선순위 값
         """
-        return (facility << 3) + severity
+        return generate_priority(facility, severity)
 
     @staticmethod
     def generate_timestamp() -> str:
@@ -34,13 +58,24 @@ class RFC3164MessageGenerator:
         이 함수는 현재 시각을 기준으로 RFC 3164 로그 형식에 맞춘 시간 문자열을 생성합니다.
         형식은 "MMM DD HH:MM:SS"이며, 월 이름은 3자리 약어로 표현됩니다.
         예: "Jan  1 12:30:45"
+        초 단위 정밀도이므로 같은 초 안의 호출은 캐시된 문자열을 재사용합니다.
         
         Returns:
             str: RFC 3164 형식의 시간 문자열
         """
-        now = datetime.datetime.now()
-        month = f"{RFC3164MessageGenerator.months[now.month-1]}"
-        return f"{month} {now.day:2d} {now.strftime('%H:%M:%S')}"
+        global _timestamp_cache
+
+        now = int(time.time())
+        cached_second, cached_timestamp = _timestamp_cache
+        if now == cached_second:
+            return cached_timestamp
+
+        local = time.localtime(now)
+        month = MONTHS[local.tm_mon - 1]
+        timestamp = (f"{month} {local.tm_mday:2d} "
+                     f"{local.tm_hour:02d}:{local.tm_min:02d}:{local.tm_sec:02d}")
+        _timestamp_cache = (now, timestamp)
+        return timestamp
 
     def generate(self, components: MessageComponents) -> str:
         """RFC3164 형식의 syslog 메시지 생성  
@@ -51,6 +86,7 @@ class RFC3164MessageGenerator:
         호스트명은 컴포넌트에서 제공되지 않을 경우 'localhost'를 사용합니다.
         태그는 컴포넌트에서 제공되지 않을 경우 'app'을 사용합니다.
         프로세스 ID는 존재할 경우 '[PID]' 형식으로 포함됩니다.
+        타임스탬프가 지정된 경우 동일한 구성 요소의 결과는 LRU 캐시에서 반환됩니다.
 
         Args:
             components (MessageComponents): syslog 메시지 구성 요소들
@@ -74,10 +110,13 @@ class RFC3164MessageGenerator:
         if priority is None:
             priority = 34  # Default: facility 4, severity 2
 
-        timestamp = components.timestamp if components.timestamp else self.generate_timestamp()
         hostname = components.hostname or "localhost"
         tag = components.tag or "app"
-        pid_str = f"[{components.pid}]" if components.pid else ""
         message = components.message or ""
 
-        return f"<{priority}>{timestamp} {hostname} {tag}{pid_str}: {message}"
+        # 타임스탬프가 고정된 경우에만 결과가 결정적이므로 캐시를 사용한다
+        if components.timestamp:
+            return _build_message_cached(priority, components.timestamp,
+                                         hostname, tag, components.pid, message)
+        return _build_message(priority, self.generate_timestamp(),
+                              hostname, tag, components.pid, message)
@@ -5,8 +5,36 @@ RFC 5424 Syslog 메시지 생성기 모듈
 Syslog 메시지는 우선순위, 타임스탬프, 호스트 이름, 애플리케이션 이름, 프로세스 ID,
 메시지 ID, 구조화된 데이터, 그리고 메시지 본문으로 구성됩니다.
 """
-import datetime
+import time
+from functools import lru_cache
 from app.models import MessageComponents
+from app.generators.priority import generate_priority
+
+_timestamp_prefix_cache = (-1, "")
+"""마지막으로 생성한 (epoch 초, 초 단위 UTC 타임스탬프 접두사) 캐시"""
+
+
+MESSAGE_TEMPLATE = "<{pri}>1 {ts} {host} {app} {pid} {mid} {sd} {msg}"
+"""RFC 5424 메시지 템플릿 (PRI, VERSION=1, TIMESTAMP, HOSTNAME, APP-NAME, PROCID, MSGID, SD, MSG)"""
+
+
+def _build_message(priority: int, timestamp: str, hostname: str, app_name: str,
+                   proc_id: str, msg_id: str, structured_data: str, message: str) -> str:
+    """기본값이 적용된 필드로 MESSAGE_TEMPLATE을 채워 RFC 5424 메시지를 만듭니다."""
+    return MESSAGE_TEMPLATE.format_map({
+        "pri": priority,
+        "ts": timestamp,
+        "host": hostname,
+        "app": app_name,
+        "pid": proc_id,
+        "mid": msg_id,
+        "sd": structured_data,
+        "msg": message,
+    })
+
+
+_build_message_cached = lru_cache(maxsize=1024)(_build_message)
+"""타임스탬프가 지정된 동일 구성 요소의 반복 생성을 위한 LRU 캐시 버전"""
 
 
 class RFC5424MessageGenerator:
@@ -28,20 +56,30 @@ class RFC5424MessageGenerator:
         Returns:
             int: 생성된 우선순위 값
         """
-        return (facility << 3) + severity
+        return generate_priority(facility, severity)
 
     @staticmethod
     def generate_timestamp() -> str:
         """RFC5424 형식의 타임스탬프 생성  
         
-        이 함수는 현재 시간을 ISO 8601 형식으로 변환하고, 
+        이 함수는 현재 UTC 시간을 ISO 8601 형식으로 변환하고, 
         RFC5424 사양에 맞게 Z 문자를 추가하여 타임스탬프를 생성합니다. 
-        반환된 타임스탬프는 로깅 시스템에서 사용할 수 있는 표준 형식입니다.
+        datetime 객체를 만들지 않고 time.gmtime 필드로 직접 포맷하며,
+        초 단위 접두사는 같은 초 안에서 재사용하고 마이크로초만 새로 붙입니다.
         
         Returns:
             str: RFC5424 호환형 타임스탬프 문자열 (예: "2023-12-01T10:30:45.123456Z")
         """
-        return datetime.datetime.now().isoformat() + "Z"
+        global _timestamp_prefix_cache
+
+        second, nanos = divmod(time.time_ns(), 1_000_000_000)
+        cached_second, prefix = _timestamp_prefix_cache
+        if second != cached_second:
+            utc = time.gmtime(second)
+            prefix = (f"{utc.tm_year:04d}-{utc.tm_mon:02d}-{utc.tm_mday:02d}T"
+                      f"{utc.tm_hour:02d}:{utc.tm_min:02d}:{utc.tm_sec:02d}")
+            _timestamp_prefix_cache = (second, prefix)
+        return f"{prefix}.{nanos // 1000:06d}Z"
 
     def generate(self, components: MessageComponents) -> str:
         """RFC 5424 형식의 syslog 메시지 생성  
@@ -50,6 +88,7 @@ class RFC5424MessageGenerator:
         syslog 메시지를 생성합니다. 우선순위, 버전, 타임스탬프, 호스트명,
         애플리케이션 이름, 프로세스 ID, 메시지 ID, 구조화된 데이터 및 메시지 내용을
         포함합니다. 필요한 구성 요소가 누락된 경우 기본값이 사용됩니다.
+        타임스탬프가 지정된 경우 동일한 구성 요소의 결과는 LRU 캐시에서 반환됩니다.
         
         Args:
             components (MessageComponents): syslog 메시지 구성 요소들
@@ -82,13 +121,16 @@ class RFC5424MessageGenerator:
         if priority is None:
             priority = 34  # Default: facility 4, severity 2
 
-        version = 1
-        timestamp = components.timestamp if components.timestamp else self.generate_timestamp()
-        hostname = components.hostname or "localhost"
-        app_name = components.app_name or "-"
-        proc_id = components.proc_id or "-"
-        msg_id = components.msg_id or "-"
-        structured_data = components.structured_data or "-"
-        message = components.message or ""
+        fields = (
+            components.hostname or "localhost",
+            components.app_name or "-",
+            components.proc_id or "-",
+            components.msg_id or "-",
+            components.structured_data or "-",
+            components.message or "",
+        )
 
-        return f"<{priority}>{version} {timestamp} {hostname} {app_name} {proc_id} {msg_id} {structured_data} {message}"
+        # 타임스탬프가 고정된 경우에만 결과가 결정적이므로 캐시를 사용한다
+        if components.timestamp:
+            return _build_message_cached(priority, components.timestamp, *fields)
+        return _build_message(priority, self.generate_timestamp(), *fields)
@@ -8,20 +8,55 @@ This module serves as the main entry point for the Syslog Generator API,
 setting up the FastAPI application with appropriate middleware, routers,
 and endpoints for interacting with syslog functionality.
 """
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.core import settings
+from app.core.database import example_db
+from app.core.log import configure_logging
 from app.routers import syslog_router, info_router
 from app.routers.examples import router as examples_router
+from app.senders import SyslogSender
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """애플리케이션 수명 주기 핸들러.
+
+    시작 시 큐 기반 로깅을 구성하고 로그 출력 리스너를 실행하며, 종료 시 데이터베이스 세션
+    레지스트리와 연결 풀, 캐시된 전송 소켓을 정리한 뒤 남은 로그를 모두 출력하고 리스너를 멈춥니다.
+    정리 작업은 수명 주기가 오류로 끝나도 실행되며, 하나가 실패해도 나머지는 계속 실행하고
+    실패는 리스너를 멈추기 전에 로그로 남깁니다.
+    모듈 임포트가 아닌 수명 주기에서 구성하므로 모듈을 다시 임포트해도 핸들러가 쌓이지 않습니다.
+    """
+    # 요청 경로의 로그는 DEBUG 수준이므로 debug 설정이 꺼져 있으면 포맷팅 비용 없이 건너뛴다
+    log_listener = configure_logging(logging.DEBUG if settings.debug else logging.INFO)
+    log_listener.start()
+    try:
+        yield
+    finally:
+        for cleanup in (example_db.close, SyslogSender.close):
+            try:
+                cleanup()
+            except Exception:
+                logger.exception("Shutdown cleanup failed: %r", cleanup)
+        log_listener.stop()
+
 
 # Create FastAPI application
 app = FastAPI(
     title=settings.app_name,
     version=settings.version,
-    description="Generate, parse and send syslog messages according to RFC 3164 & 5424 standards"
+    description="Generate, parse and send syslog messages according to RFC 3164 & 5424 standards",
+    lifespan=lifespan
 )
 """FastAPI 애플리케이션 인스턴스를 생성"""
 
@@ -4,8 +4,10 @@ from .syslog import (
     RFC3164SyslogMessage,
     MessageComponents,
     SyslogRequest,
+    SyslogBatchRequest,
     GenerateRequest,
     SyslogResponse,
+    SyslogBatchResponse,
 )
 
 __all__ = [
@@ -14,6 +16,8 @@ __all__ = [
     "RFC3164SyslogMessage",
     "MessageComponents",
     "SyslogRequest",
+    "SyslogBatchRequest",
     "GenerateRequest",
     "SyslogResponse",
+    "SyslogBatchResponse",
 ]
\ No newline at end of file
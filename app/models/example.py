@@ -6,7 +6,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CustomExample(BaseModel):
@@ -34,6 +34,9 @@ class CreateExampleRequest(BaseModel):
     이 모델은 예제 생성에 필요한 기본 정보를 담고 있으며, 
     필수 필드는 name과 rfc_version이며, description과 raw_message는 선택적으로 제공된다.
     """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     name: str
     """예제 이름"""
     description: Optional[str] = None
@@ -47,6 +50,8 @@ class CreateExampleRequest(BaseModel):
 class UpdateExampleRequest(BaseModel):
     """업데이트 요청 데이터 모델을 정의한다."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     name: Optional[str] = None
     """이름 필드 - 선택사항으로, 업데이트할 이름을 포함한다."""
     description: Optional[str] = None
@@ -1,11 +1,13 @@
 """Syslog Message 데이터 모델"""
-from typing import Optional, Union
-from pydantic import BaseModel
+from typing import Annotated, List, Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SyslogMessage(BaseModel):
     """시스템 로그 메시지 공통 데이터 모델을 정의한다."""
 
+    model_config = ConfigDict(frozen=True)
+
     priority: int
     """로그 우선순위 값을 정의한다."""
 
@@ -33,16 +35,29 @@ class SyslogMessage(BaseModel):
 class RFC3164SyslogMessage(SyslogMessage):
     """RFC 3164 형식의 시스템 로그 메시지 데이터 모델을 정의한다."""
 
+    model_config = ConfigDict(frozen=True)
+
     tag: str
     """로그 메시지를 식별하는 태그 정보를 포함한다."""
 
+    pid: Optional[int] = None
+    """태그의 [PID]에서 추출한 프로세스 ID이며, 존재하지 않을 경우 None으로 설정된다."""
+
+    rfc_version: Literal["3164"] = "3164"
+    """RFC 버전 구분값으로, 응답 union의 판별자로 사용된다."""
+
 
 class RFC5424SyslogMessage(SyslogMessage):
     """RFC 5424 형식의 시스로그 메시지 모델을 정의한다."""
 
+    model_config = ConfigDict(frozen=True)
+
     version: int = 1
     """RFC 5424 버전 번호를 나타낸다."""
 
+    rfc_version: Literal["5424"] = "5424"
+    """RFC 버전 구분값으로, 응답 union의 판별자로 사용된다."""
+
     app_name: Optional[str] = None
     """애플리케이션 이름을 나타낸다."""
 
@@ -56,6 +71,8 @@ class RFC5424SyslogMessage(SyslogMessage):
 class MessageComponents(BaseModel):
     """RFC 3164 및 5424 형식의 시스템 로그 메시지 구성 요소를 나타냅니다."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     rfc_version: str  # "3164" or "5424"
     """RFC 버전 (3164 또는 5424)"""
 
@@ -102,6 +119,8 @@ class MessageComponents(BaseModel):
 class SyslogRequest(BaseModel):
     """Syslog 요청 데이터 모델을 정의합니다."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     raw_message: str
     """원시 syslog 메시지 내용을 저장합니다."""
 
@@ -115,12 +134,35 @@ class SyslogRequest(BaseModel):
     """전송에 사용할 프로토콜을 저장합니다. 기본값은 udp입니다."""
 
     rfc_version: str = "3164"
-    """사용할 RFC 버전을 저장합니다. 기본값은 3164입니다."""
+    """사용할 RFC 버전("3164", "5424" 또는 메시지 헤더로 판별하는 "auto")을 저장합니다. 기본값은 3164입니다."""
+
+
+class SyslogBatchRequest(BaseModel):
+    """여러 syslog 메시지를 한 번에 파싱 및 전송하는 요청 데이터 모델을 정의합니다."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    raw_messages: List[str]
+    """원시 syslog 메시지 목록을 저장합니다."""
+
+    target_server: str
+    """메시지를 전송할 대상 서버 주소를 저장합니다."""
+
+    target_port: int = 514
+    """대상 서버의 포트 번호를 저장합니다. 기본값은 514입니다."""
+
+    protocol: str = "udp"
+    """전송에 사용할 프로토콜을 저장합니다. 기본값은 udp입니다."""
+
+    rfc_version: str = "3164"
+    """사용할 RFC 버전("3164", "5424" 또는 메시지 헤더로 판별하는 "auto")을 저장합니다. 기본값은 3164입니다."""
 
 
 class GenerateRequest(BaseModel):
     """Syslog 메시지 생성 요청 데이터 모델입니다."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     components: MessageComponents
     """메시지 구성 요소들"""
     target_server: str
@@ -137,7 +179,10 @@ class SyslogResponse(BaseModel):
     success: bool
     """처리 성공 여부를 나타내는 boolean 값입니다."""
 
-    parsed_message: Optional[Union[SyslogMessage, RFC5424SyslogMessage]] = None
+    parsed_message: Optional[Annotated[
+        Union[RFC3164SyslogMessage, RFC5424SyslogMessage],
+        Field(discriminator="rfc_version")
+    ]] = None
     """파싱된 syslog 메시지 객체입니다. 파싱에 실패한 경우 None입니다."""
 
     error: Optional[str] = None
@@ -148,3 +193,25 @@ class SyslogResponse(BaseModel):
 
     generated_message: Optional[str] = None
     """생성된 syslog 메시지 문자열입니다. 생성되지 않은 경우 None입니다."""
+
+
+class SyslogBatchResponse(BaseModel):
+    """여러 syslog 메시지 처리 결과를 담는 응답 데이터 구조를 정의하는 클래스입니다."""
+
+    success: bool
+    """처리 성공 여부를 나타내는 boolean 값입니다."""
+
+    parsed_messages: List[Annotated[
+        Union[RFC3164SyslogMessage, RFC5424SyslogMessage],
+        Field(discriminator="rfc_version")
+    ]] = []
+    """입력 순서대로 파싱된 syslog 메시지 목록입니다. 실패한 경우 빈 목록입니다."""
+
+    sent_count: int = 0
+    """전송한 메시지 수입니다."""
+
+    error: Optional[str] = None
+    """처리 중 발생한 오류 메시지입니다. 성공적인 처리인 경우 None입니다."""
+
+    sent_to: Optional[str] = None
+    """메시지가 전송된 대상입니다. 전송되지 않은 경우 None입니다."""
@@ -1,7 +1,13 @@
 """Parser service"""
+import logging
+from functools import lru_cache
+from typing import Iterable, List, Union
+
 from app.models import SyslogMessage
 from app.parsers import RFC3164Parser, RFC5424Parser
+from app.parsers.rfc3164 import _current_year
 
+logger = logging.getLogger(__name__)
 
 rfc3164_parser = RFC3164Parser()
 """RFC3164Parser: RFC3164 형식 syslog 메시지를 파싱하는 인스턴스"""
@@ -9,20 +15,86 @@ rfc3164_parser = RFC3164Parser()
 rfc5424_parser = RFC5424Parser()
 """RFC5424Parser: RFC5424 형식 syslog 메시지를 파싱하는 인스턴스"""
 
-def parse(version: str, msg: str) -> SyslogMessage:
+PARSERS = {
+    "3164": rfc3164_parser.parse,
+    "5424": rfc5424_parser.parse,
+}
+"""RFC 버전별 파싱 함수 디스패치 테이블"""
+
+AUTO_VERSION = "auto"
+"""메시지 헤더로 RFC 버전을 판별하도록 요청하는 버전 값"""
+
+
+def detect_rfc_version(msg: Union[str, bytes]) -> str:
+    """메시지 헤더만 보고 RFC 버전을 판별합니다.
+
+    "<PRI>" 바로 다음 문자가 RFC 5424에서는 VERSION 숫자("<34>1 2003-..."),
+    RFC 3164에서는 월 이름("<34>Oct 11 ...")이므로 한 번의 find와 문자 검사로 구분합니다.
+    형식을 알 수 없는 메시지는 RFC 3164로 판별하여 해당 파서가 오류를 보고하게 합니다.
+
+    Args:
+        msg (Union[str, bytes]): 판별할 syslog 메시지 문자열 또는 원시 바이트입니다.
+
+    Returns:
+        str: "5424" 또는 "3164"
+    """
+    pri_end = msg.find(b'>' if isinstance(msg, bytes) else '>')
+    if pri_end >= 0 and msg[pri_end + 1:pri_end + 2].isdigit():
+        return "5424"
+    return "3164"
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(version: str, msg: Union[str, bytes], year: int) -> SyslogMessage:
+    """(버전, 원시 메시지, 현재 연도) 단위로 파싱 결과를 캐시하는 LRU 캐시 버전
+
+    RFC 3164 타임스탬프의 연도는 파싱 시점의 현재 연도로 채워지므로, 연도를 키에 포함하여
+    해가 바뀐 뒤에는 지난해에 캐시된 결과를 반환하지 않습니다.
+    """
+    return PARSERS.get(version, rfc3164_parser.parse)(msg)
+
+
+def parse(version: str, msg: Union[str, bytes]) -> SyslogMessage:
     """지정된 버전에 따라 syslog 메시지를 파싱합니다.
 
+    syslog 스트림은 같은 줄이 반복되는 경우가 많으므로 동일한 입력의 결과는 LRU 캐시에서
+    반환합니다. 반환된 객체는 캐시와 공유되므로 변경할 수 없는(frozen) 모델입니다.
+
     Args:
         version (str): 파싱할 메시지의 버전으로, "5424" 또는 다른 값이 될 수 있습니다.
-        msg (str): 파싱할 syslog 메시지 문자열입니다.
+            "auto"이면 detect_rfc_version으로 판별하고, PARSERS에 없는 값은 RFC 3164로 처리합니다.
+        msg (Union[str, bytes]): 파싱할 syslog 메시지 문자열 또는 수신한 원시 바이트입니다.
 
     Returns:
         SyslogMessage: 파싱된 syslog 메시지 객체를 반환합니다.
     """
-    parsed_message: SyslogMessage
-    if version == "5424":
-        parsed_message = rfc5424_parser.parse(msg)
-    else:
-        parsed_message = rfc3164_parser.parse(msg)
-    print(f"Message parsed successfully: {parsed_message}")
+    if version == AUTO_VERSION:
+        version = detect_rfc_version(msg)
+    parsed_message = _parse_cached(version, msg, _current_year())
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Message parsed successfully: %s", parsed_message)
     return parsed_message
+
+
+def parse_many(version: str, messages: Iterable[Union[str, bytes]]) -> List[SyslogMessage]:
+    """같은 버전의 syslog 메시지 여러 개를 한 번에 파싱합니다.
+
+    버전별 파서 선택과 캐시 함수 조회를 배치당 한 번만 수행하여 메시지당 호출 비용을 줄입니다.
+    메시지 중 하나라도 형식이 잘못되면 ValueError가 발생합니다.
+
+    Args:
+        version (str): 파싱할 메시지들의 버전으로, "5424" 또는 다른 값이 될 수 있습니다.
+            "auto"이면 메시지마다 detect_rfc_version으로 판별합니다.
+        messages (Iterable[Union[str, bytes]]): 파싱할 syslog 메시지 목록입니다.
+
+    Returns:
+        List[SyslogMessage]: 입력 순서대로 파싱된 syslog 메시지 객체 목록을 반환합니다.
+    """
+    year = _current_year()
+    parse_cached = _parse_cached
+    if version == AUTO_VERSION:
+        return [parse_cached(detect_rfc_version(msg), msg, year) for msg in messages]
+    if version not in PARSERS:
+        version = "3164"
+    return [parse_cached(version, msg, year) for msg in messages]
@@ -0,0 +1,32 @@
+"""
+Syslog 우선순위(PRI) 해석 모듈
+
+"<PRI>" 헤더의 숫자 문자열(0-191)에 대한 (priority, facility, severity) 값을 모듈 로드 시
+미리 계산해 두고 파서에서 int() 변환과 비트 연산 대신 사전 조회로 사용합니다.
+"""
+from typing import Dict, Tuple
+
+PRI_FIELDS: Dict[str, Tuple[int, int, int]] = {
+    str(priority): (priority, priority >> 3, priority & 7)
+    for priority in range(192)
+}
+"""우선순위 숫자 문자열별 (priority, facility, severity) 테이블"""
+
+
+def decode_priority(priority_str: str) -> Tuple[int, int, int]:
+    """우선순위 숫자 문자열을 priority, facility, severity로 변환
+
+    표준 범위의 값은 PRI_FIELDS에서 한 번에 조회하고, 앞에 0이 붙었거나 범위를 벗어난 값은
+    직접 변환합니다.
+
+    Args:
+        priority_str (str): "<PRI>" 헤더에서 꺼낸 숫자 문자열
+
+    Returns:
+        tuple: (priority: int, facility: int, severity: int)
+    """
+    fields = PRI_FIELDS.get(priority_str)
+    if fields is None:
+        priority = int(priority_str)
+        fields = (priority, priority >> 3, priority & 7)
+    return fields
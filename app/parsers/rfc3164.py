@@ -4,31 +4,80 @@ RFC 3164 Syslog 메시지 파서 모듈.
 이 모듈은 RFC 3164 형식의 syslog 메시지를 파싱하여
 SyslogMessage 객체로 변환하는 기능을 제공한다.
 """
-import datetime
-import re
+import calendar
+import time
+from functools import lru_cache
+from typing import Tuple, Union
 from app.models import RFC3164SyslogMessage
+from app.parsers.priority import decode_priority
+
+_year_cache: Tuple[float, int] = (0.0, 0)
+"""(캐시 만료 epoch 초, 현재 연도) 캐시. 다음 해 1월 1일 0시(로컬)에 만료된다."""
+
+MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+"""월 이름을 숫자로 매핑하는 딕셔너리"""
+
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+"""월(1-12)별 일 수 테이블 (윤년 2월은 별도 처리)"""
+
+
+def _current_year() -> int:
+    """현재 연도를 반환한다. 해가 바뀔 때까지 캐시된 값을 재사용한다."""
+    global _year_cache
+
+    expires_at, year = _year_cache
+    now = time.time()
+    if now < expires_at:
+        return year
+
+    year = time.localtime(now).tm_year
+    _year_cache = (time.mktime((year + 1, 1, 1, 0, 0, 0, 0, 0, -1)), year)
+    return year
+
+
+@lru_cache(maxsize=4096)
+def _timestamp_to_iso(timestamp_str: str, year: int) -> str:
+    """RFC3164 타임스탬프 문자열과 연도로 ISO 8601 문자열을 만든다.
+
+    같은 초에 발생한 메시지는 타임스탬프 문자열이 같으므로 (문자열, 연도) 단위로 결과를 캐시한다.
+    연도를 키에 포함하므로 해가 바뀌면 자동으로 새 값이 계산된다.
+    """
+    try:
+        parts = timestamp_str.split()
+        month_name = parts[0]
+        day = int(parts[1])
+        time_part = parts[2]
+
+        month = MONTHS.get(month_name)
+        if not month:
+            raise ValueError(f"Invalid month: {month_name}")
+
+        hour, minute, second = map(int, time_part.split(':'))
+
+        max_day = 29 if month == 2 and calendar.isleap(year) else DAYS_IN_MONTH[month]
+        if not 1 <= day <= max_day:
+            raise ValueError("day is out of range for month")
+        if not (0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60):
+            raise ValueError("time is out of range")
+
+        # datetime 객체를 만들지 않고 isoformat()과 같은 문자열을 직접 조립한다
+        return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}"
+
+    except (ValueError, IndexError) as e:
+        raise ValueError(f'Invalid timestamp format: {e}') from e
 
 
 class RFC3164Parser:
     """RFC 3164 형식의 로그 메시지를 파싱하는 클래스입니다."""
 
-    MONTHS = {
-        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-        'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-    }
+    MONTHS = MONTHS
     """월 이름을 숫자로 매핑하는 딕셔너리입니다."""
 
-    RFC3164_PATTERN = re.compile(
-        r'^<(\d+)>'
-        r'(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+'
-        r'(\S+)\s+'
-        r'([^:\[\s]+)(?:\[(\d+)\])?:\s*'
-        r'(.*)$'
-    )
-    """RFC 3164 로그 형식을 파싱하기 위한 정규 표현식입니다."""
-
     @staticmethod
-    def parse_priority(priority: int) -> tuple:
+    def parse_priority(priority: int) -> Tuple[int, int]:
         """설정 우선순위를 시설 코드와 심각도로 분리  
 
         주어진 우선순위 정수를 비트 연산을 통해 시설(facility) 코드와 심각도(severity)로 분리합니다.
@@ -50,7 +99,7 @@ class RFC3164Parser:
 
         주어진 RFC3164 형식의 타임스탬프 문자열을 파싱하여 ISO 8601 형식의 문자열로 반환한다.
         형식은 "MMM DD HH:MM:SS" 또는 "MMM DD HH:MM" 형태를 지원하며, 
-        연도 정보는 현재 연도로 설정된다. 월 이름은 영문 약어(예: Jan, Feb)로 주어져야 하며,
+        연도 정보는 현재 연도로 설정되며, 연도는 해가 바뀔 때까지 캐시된다. 변환 결과는 (문자열, 연도) 단위로 LRU 캐시된다. 월 이름은 영문 약어(예: Jan, Feb)로 주어져야 하며,
         유효하지 않은 월 이름이나 시간 형식일 경우 ValueError 예외를 발생시킨다.
 
         Args:
@@ -63,32 +112,17 @@ class RFC3164Parser:
         Returns:
             str: ISO 8601 형식의 타임스탬프 문자열
         """
-        try:
-            parts = timestamp_str.split()
-            month_name = parts[0]
-            day = int(parts[1])
-            time_part = parts[2]
-
-            month = RFC3164Parser.MONTHS.get(month_name)
-            if not month:
-                raise ValueError(f"Invalid month: {month_name}")
-
-            year = datetime.datetime.now().year
-            hour, minute, second = map(int, time_part.split(':'))
-
-            dt = datetime.datetime(year, month, day, hour, minute, second)
-            return dt.isoformat()
-
-        except (ValueError, IndexError) as e:
-            raise ValueError(f'Invalid timestamp format: {e}') from e
+        return _timestamp_to_iso(timestamp_str, _current_year())
 
-    def parse(self, raw_message: str) -> RFC3164SyslogMessage:
+    def parse(self, raw_message: Union[str, bytes]) -> RFC3164SyslogMessage:
         """RFC 3164 형식의 원시 메시지를 파싱  
         주어진 RFC 3164 형식의 원시 시스템 로그 메시지를 분석하여 SyslogMessage 객체로 변환한다. 
+        정규 표현식 대신 str.find/str.split으로 각 필드를 한 번씩만 훑어 토큰을 분리한다.
         메시지 형식이 유효하지 않거나 파싱 중에 오류가 발생하면 ValueError 예외를 발생시킨다.
 
         Args:
-            raw_message (str): 파싱할 RFC 3164 형식의 원시 메시지
+            raw_message (Union[str, bytes]): 파싱할 RFC 3164 형식의 원시 메시지.
+                수신한 데이터그램(bytes)은 UTF-8로 한 번만 디코딩한다.
 
         Raises:
             ValueError: 메시지 형식이 유효하지 않거나 파싱 중 오류가 발생한 경우
@@ -96,18 +130,50 @@ class RFC3164Parser:
         Returns:
             SyslogMessage: 파싱된 시스템 로그 메시지 정보를 담은 객체
         """
-        match = self.RFC3164_PATTERN.match(raw_message.strip())
+        if isinstance(raw_message, bytes):
+            raw_message = raw_message.decode('utf-8', errors='replace')
+        msg = raw_message.strip()
 
-        if not match:
+        # <PRI>
+        pri_end = msg.find('>', 1)
+        if not msg.startswith('<') or pri_end < 2 or not msg[1:pri_end].isdigit():
             raise ValueError("Invalid RFC 3164 syslog format")
+        priority_str = msg[1:pri_end]
 
-        priority_str, timestamp_str, hostname, tag, pid_str, message = match.groups()
+        # TIMESTAMP("MMM D HH:MM:SS"), HOSTNAME은 공백으로 구분되고 나머지는 TAG부터 시작한다
+        fields = msg[pri_end + 1:].split(None, 4)
+        if len(fields) < 5 or msg[pri_end + 1].isspace():
+            raise ValueError("Invalid RFC 3164 syslog format")
+        month_str, day_str, time_str, hostname, rest = fields
+        if (len(month_str) != 3 or not month_str.isalnum()
+                or len(day_str) > 2 or not day_str.isdigit()
+                or len(time_str) != 8 or time_str[2] != ':' or time_str[5] != ':'
+                or not (time_str[:2] + time_str[3:5] + time_str[6:]).isdigit()):
+            raise ValueError("Invalid RFC 3164 syslog format")
+        timestamp_str = f"{month_str} {day_str} {time_str}"
+
+        # TAG[PID]: MSG
+        colon = rest.find(':')
+        if colon < 0:
+            raise ValueError("Invalid RFC 3164 syslog format")
+        tag = rest[:colon]
+        pid_str = None
+        bracket = tag.find('[')
+        if bracket >= 0:
+            pid_str = tag[bracket + 1:-1]
+            if not tag.endswith(']') or not pid_str.isdigit():
+                raise ValueError("Invalid RFC 3164 syslog format")
+            tag = tag[:bracket]
+        if tag.split() != [tag]:
+            raise ValueError("Invalid RFC 3164 syslog format")
+        message = rest[colon + 1:].lstrip()
+        if '\n' in message:
+            raise ValueError("Invalid RFC 3164 syslog format")
 
         try:
-            priority = int(priority_str)
-            facility, severity = self.parse_priority(priority)
+            priority, facility, severity = decode_priority(priority_str)
             timestamp = self.parse_timestamp(timestamp_str)
-            pid = pid_str if pid_str else None
+            pid = int(pid_str) if pid_str is not None else None
 
             return RFC3164SyslogMessage(
                 priority=priority,
@@ -3,8 +3,9 @@
 이 모듈은 RFC 5424 형식의 syslog 메시지를 파싱하여 
 메시지의 각 필드를 추출하고, RFC5424SyslogMessage 객체로 반환한다.
 """
-import re
+from typing import Tuple, Union
 from app.models import RFC5424SyslogMessage
+from app.parsers.priority import decode_priority
 
 
 class RFC5424Parser:
@@ -14,22 +15,8 @@ class RFC5424Parser:
     필요한 정보를 추출하여 RFC5424SyslogMessage 객체로 반환합니다.
     """
 
-    RFC5424_PATTERN = re.compile(
-        r'^<(\d+)>'  # Priority
-        r'(\d+)\s+'  # Version
-        r'(\S+)\s+'  # Timestamp
-        r'(\S+)\s+'  # Hostname
-        r'(\S+)\s+'  # App-Name
-        r'(\S+)\s+'  # ProcID
-        r'(\S+)\s+'  # MsgID
-        r'(-|\[.*?\](?:\[.*?\])*)\s*'  # Structured-Data (can be "-" or one/more [SD elements])
-        r'(.*)$'     # Message
-    )
-    """RFC 5424 형식을 위한 정규 표현식 패턴"""
-
-
     @staticmethod
-    def parse_priority(priority: int) -> tuple:
+    def parse_priority(priority: int) -> Tuple[int, int]:
         """RFC 5424 우선순위 값을 파싱하여 시설과 심각도로 분리
 
         주어진 우선순위 정수에서 시설(facility)과 심각도(severity)를 추출합니다.
@@ -46,15 +33,47 @@ class RFC5424Parser:
         severity = priority & 7
         return facility, severity
 
-    def parse(self, raw_message: str) -> RFC5424SyslogMessage:
+    @staticmethod
+    def _scan_sd_element(text: str, pos: int) -> int:
+        """text[pos]의 '['로 시작하는 SD-ELEMENT의 끝 위치 탐색
+
+        이스케이프된 "\\]"는 건너뛰고 첫 번째 이스케이프되지 않은 ']'를 찾는다.
+        요소 안에 줄바꿈이 있거나 닫히지 않은 경우 -1을 반환한다.
+
+        Args:
+            text (str): SD가 포함된 문자열
+            pos (int): '['의 위치
+
+        Returns:
+            int: 닫는 ']' 다음 위치, 유효한 요소가 아니면 -1
+        """
+        if not text.startswith('[', pos):
+            return -1
+        start = pos + 1
+        while True:
+            close = text.find(']', start)
+            if close < 0:
+                return -1
+            segment = text[start:close]
+            if '\n' in segment:
+                return -1
+            backslash = segment.find('\\')
+            if backslash < 0:
+                return close + 1
+            # 이스케이프된 다음 문자(']' 포함)를 건너뛰고 이어서 탐색한다
+            start += backslash + 2
+
+    def parse(self, raw_message: Union[str, bytes]) -> RFC5424SyslogMessage:
         """RFC 5424 형식의 원시 메시지를 파싱하여 구조화된 메시지로 변환
 
         주어진 원시 syslog 메시지를 RFC 5424 표준에 따라 파싱하고, 필요한 필드들을 추출하여
         RFC5424SyslogMessage 객체로 반환한다. 파싱 과정에서 형식이 잘못된 경우 ValueError를 발생시킨다.
         nil 값 처리를 위해 "-" 문자열은 None으로 변환된다.
+        헤더 필드는 str.split으로 나누고, 구조화된 데이터는 _scan_sd_element로 요소 단위로 훑는다.
 
         Args:
-            raw_message (str): 파싱할 RFC 5424 형식의 원시 syslog 메시지
+            raw_message (Union[str, bytes]): 파싱할 RFC 5424 형식의 원시 syslog 메시지.
+                수신한 데이터그램(bytes)은 UTF-8로 한 번만 디코딩한다.
 
         Raises:
             ValueError: 입력 메시지가 RFC 5424 형식이 아닌 경우
@@ -63,24 +82,51 @@ class RFC5424Parser:
         Returns:
             RFC5424SyslogMessage: 파싱된 syslog 메시지 정보를 담은 객체
         """
-        match = self.RFC5424_PATTERN.match(raw_message.strip())
+        if isinstance(raw_message, bytes):
+            raw_message = raw_message.decode('utf-8', errors='replace')
+        msg = raw_message.strip()
 
-        if not match:
+        # <PRI>VERSION
+        pri_end = msg.find('>', 1)
+        if not msg.startswith('<') or pri_end < 2 or not msg[1:pri_end].isdigit():
             raise ValueError("Invalid RFC 5424 syslog format")
+        priority_str = msg[1:pri_end]
 
-        priority_str, version_str, timestamp_str, hostname,\
-            app_name, proc_id, msg_id, structured_data, message = match.groups()
+        # VERSION TIMESTAMP HOSTNAME APP-NAME PROCID MSGID 이후 나머지는 SD부터 시작한다
+        fields = msg[pri_end + 1:].split(None, 6)
+        if len(fields) < 7 or not fields[0].isdigit() or msg[pri_end + 1].isspace():
+            raise ValueError("Invalid RFC 5424 syslog format")
+        version_str, timestamp_str, hostname, app_name, proc_id, msg_id, rest = fields
+
+        # STRUCTURED-DATA: "-" 또는 하나 이상의 [SD-ELEMENT]
+        if rest[0] == '-':
+            sd_end = 1
+            structured_data = None
+        else:
+            sd_end = self._scan_sd_element(rest, 0)
+            if sd_end < 0:
+                raise ValueError("Invalid RFC 5424 syslog format")
+            while rest.startswith('[', sd_end):
+                element_end = self._scan_sd_element(rest, sd_end)
+                if element_end < 0:
+                    break
+                sd_end = element_end
+            structured_data = rest[:sd_end]
+
+        # MSG
+        message = rest[sd_end:].lstrip()
+        if '\n' in message:
+            raise ValueError("Invalid RFC 5424 syslog format")
 
         try:
-            priority = int(priority_str)
-            version = int(version_str)
-            facility, severity = self.parse_priority(priority)
-
-            # Handle nil values
-            app_name = None if app_name == "-" else app_name
-            proc_id = None if proc_id == "-" else proc_id
-            msg_id = None if msg_id == "-" else msg_id
-            structured_data = None if structured_data == "-" else structured_data
+            priority, facility, severity = decode_priority(priority_str)
+            version = 1 if version_str == "1" else int(version_str)
+
+            # Handle nil values (SD의 nil은 토큰 분리 단계에서 이미 None으로 처리됨)
+            # 실제 값이 흔한 경우이므로 먼저 비교하고, 리스트 컴프리헨션 없이 필드별로 치환한다
+            app_name = app_name if app_name != "-" else None
+            proc_id = proc_id if proc_id != "-" else None
+            msg_id = msg_id if msg_id != "-" else None
 
             return RFC5424SyslogMessage(
                 priority=priority,
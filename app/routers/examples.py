@@ -4,12 +4,13 @@
 이 모듈은 예제 생성, 조회, 수정, 삭제 기능을 제공하는 FastAPI 라우터입니다.
 예제는 이름, 설명, RFC 버전, 원본 메시지로 구성되며,
 데이터베이스와 연동하여 CRUD 작업을 처리합니다.
+동기 SQLite 작업은 이벤트 루프를 막지 않도록 스레드 풀에서 실행합니다.
 """
-from sqlite3 import (DataError, IntegrityError, OperationalError,
-                     ProgrammingError)
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import DBAPIError
 
 from app.core.database import example_db
 from app.models.example import (CreateExampleRequest, ExampleResponse,
@@ -36,14 +37,34 @@ async def create_example(request: CreateExampleRequest) -> ExampleResponse:
         ExampleResponse: 예시 생성 결과와 생성된 예시 데이터 또는 에러 메시지를 담은 응답 객체
     """
     try:
-        example = example_db.create_example(
+        example = await run_in_threadpool(
+            example_db.create_example,
             name=request.name,
             description=request.description,
             rfc_version=request.rfc_version,
             raw_message=request.raw_message
         )
         return ExampleResponse(success=True, example=example)
-    except (IntegrityError, DataError, OperationalError, ProgrammingError) as e:
+    except (ValueError, DBAPIError) as e:
+        return ExampleResponse(success=False, error=str(e))
+
+
+@router.post("/bulk", response_model=ExampleResponse)
+async def create_examples_bulk(requests: List[CreateExampleRequest]) -> ExampleResponse:
+    """여러 예시를 한 번에 생성하는 함수
+
+    요청된 예시 목록을 하나의 트랜잭션으로 데이터베이스에 저장합니다.
+
+    Args:
+        requests (List[CreateExampleRequest]): 생성할 예시 정보 목록
+
+    Returns:
+        ExampleResponse: 생성된 예시 목록 또는 에러 메시지를 담은 응답 객체
+    """
+    try:
+        examples = await run_in_threadpool(example_db.create_examples_bulk, requests)
+        return ExampleResponse(success=True, examples=examples)
+    except (ValueError, DBAPIError) as e:
         return ExampleResponse(success=False, error=str(e))
 
 
@@ -61,9 +82,9 @@ async def get_examples(rfc_version: Optional[str] = None) -> ExampleResponse:
         ExampleResponse: 예시 목록 또는 오류 정보를 포함한 응답 객체
     """
     try:
-        examples = example_db.get_examples(rfc_version=rfc_version)
+        examples = await run_in_threadpool(example_db.get_examples, rfc_version=rfc_version)
         return ExampleResponse(success=True, examples=examples)
-    except (DataError, IntegrityError, OperationalError, ProgrammingError) as e:
+    except DBAPIError as e:
         return ExampleResponse(success=False, error=str(e))
 
 
@@ -85,11 +106,11 @@ async def get_example(example_id: int) -> ExampleResponse:
         ExampleResponse: 조회 결과를 포함한 응답 객체
     """
     try:
-        example = example_db.get_example(example_id)
+        example = await run_in_threadpool(example_db.get_example, example_id)
         if not example:
             raise HTTPException(status_code=404, detail=EXAMPLE_NOT_FOUND_MSG)
         return ExampleResponse(success=True, example=example)
-    except (DataError, IntegrityError, OperationalError, ProgrammingError) as e:
+    except DBAPIError as e:
         return ExampleResponse(success=False, error=str(e))
 
 
@@ -111,7 +132,8 @@ async def update_example(example_id: int, request: UpdateExampleRequest) -> Exam
         ExampleResponse: 업데이트 결과와 예시 항목 정보를 담은 응답 객체
     """
     try:
-        example = example_db.update_example(
+        example = await run_in_threadpool(
+            example_db.update_example,
             example_id=example_id,
             name=request.name,
             description=request.description,
@@ -121,7 +143,7 @@ async def update_example(example_id: int, request: UpdateExampleRequest) -> Exam
         if not example:
             raise HTTPException(status_code=404, detail=EXAMPLE_NOT_FOUND_MSG)
         return ExampleResponse(success=True, example=example)
-    except (DataError, IntegrityError, OperationalError, ProgrammingError) as e:
+    except DBAPIError as e:
         return ExampleResponse(success=False, error=str(e))
 
 
@@ -142,9 +164,9 @@ async def delete_example(example_id: int) -> ExampleResponse:
         ExampleResponse: 삭제 성공 여부와 오류 메시지를 포함한 응답
     """
     try:
-        success = example_db.delete_example(example_id)
+        success = await run_in_threadpool(example_db.delete_example, example_id)
         if not success:
             raise HTTPException(status_code=404, detail=EXAMPLE_NOT_FOUND_MSG)
         return ExampleResponse(success=True)
-    except (DataError, IntegrityError, OperationalError, ProgrammingError) as e:
+    except DBAPIError as e:
         return ExampleResponse(success=False, error=str(e))
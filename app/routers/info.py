@@ -23,6 +23,7 @@ async def api_info() -> dict[str, Any]:
         "description": "Parse and send RFC 3164/5424 syslog messages",
         "endpoints": {
             "POST /api/syslog/parse": "Parse and send syslog message (raw)",
+            "POST /api/syslog/parse-batch": "Parse and send multiple syslog messages in one batch (raw)",
             "POST /api/syslog/parse-only": "Parse syslog message only (raw)",
             "POST /api/syslog/generate": "Generate and send syslog message (from components)",
             "POST /api/syslog/generate-only": "Generate syslog message only (from components)",
@@ -4,13 +4,16 @@ Syslog 처리를 위한 API 라우터 모듈
 이 모듈은 syslog 메시지의 파싱, 생성, 전송 기능을 제공하며,
 RFC 3164와 RFC 5424 형식을 지원한다.
 """
+import logging
 from typing import Any
 from fastapi import APIRouter, Form
 from app.models import (
     SyslogRequest,
+    SyslogBatchRequest,
     GenerateRequest,
     MessageComponents,
     SyslogResponse,
+    SyslogBatchResponse,
     SyslogMessage,
 )
 
@@ -19,6 +22,8 @@ from app.generators import generator_service
 from app.senders import SyslogSender
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/syslog", tags=["syslog"])
 """API 라우터를 설정"""
 
@@ -28,6 +33,7 @@ async def parse_syslog(request: SyslogRequest) -> SyslogResponse:
     """syslog 메시지를 파싱 및 전송
 
     요청된 RFC 버전에 따라 적절한 파서를 선택하여 syslog 메시지를 파싱합니다. 
+    rfc_version이 "auto"이면 메시지 헤더로 RFC 3164와 5424를 판별합니다.
     파싱이 성공적으로 완료되면 지정된 프로토콜(UDP 또는 TCP)을 사용하여 메시지를 전송합니다.
     전송 실패 시 예외 처리를 통해 오류 정보를 반환합니다.
 
@@ -40,7 +46,7 @@ async def parse_syslog(request: SyslogRequest) -> SyslogResponse:
     Returns:
         SyslogResponse: 파싱 결과와 전송 상태를 포함하는 응답
     """
-    print(f"Received request: {request}")
+    logger.debug("Received request: %s", request)
 
     try:
         parsed_message: SyslogMessage = parse_service.parse(
@@ -58,23 +64,66 @@ async def parse_syslog(request: SyslogRequest) -> SyslogResponse:
             sent_to=f"{request.target_server}:{request.target_port} ({request.protocol.upper()})"
         )
 
-        print(f"Response: {response}")
+        logger.debug("Response: %s", response)
         return response
 
     except ValueError as e:
-        print(f"Validation error: {e}")
+        logger.debug("Validation error: %s", e)
         return SyslogResponse(
             success=False,
             error=str(e)
         )
     except ConnectionError as e:
-        print(f"Transmission error: {e}")
+        logger.warning("Transmission error: %s", e)
         return SyslogResponse(
             success=False,
             error=f"Transmission error: {str(e)}"
         )
 
 
+@router.post("/parse-batch", response_model=SyslogBatchResponse)
+async def parse_syslog_batch(request: SyslogBatchRequest) -> SyslogBatchResponse:
+    """여러 syslog 메시지를 파싱 및 일괄 전송
+
+    모든 메시지를 요청된 RFC 버전으로 먼저 파싱하고, 하나라도 형식이 잘못되면 전송하지 않습니다.
+    rfc_version이 "auto"이면 메시지마다 헤더로 버전을 판별하므로 두 형식을 섞어 보낼 수 있습니다.
+    파싱이 모두 성공하면 SyslogSender.send_many로 묶어서 전송하여 메시지당 전송 비용을 줄입니다.
+
+    Args:
+        request (SyslogBatchRequest): 일괄 파싱 및 전송에 필요한 요청 데이터
+
+    Returns:
+        SyslogBatchResponse: 파싱 결과 목록과 전송 개수를 포함하는 응답
+    """
+    try:
+        parsed_messages = parse_service.parse_many(
+            request.rfc_version, request.raw_messages
+        )
+
+        sent_count = await SyslogSender.send_many(
+            request.protocol.lower(), request.raw_messages,
+            request.target_server, request.target_port
+        )
+
+        return SyslogBatchResponse(
+            success=True,
+            parsed_messages=parsed_messages,
+            sent_count=sent_count,
+            sent_to=f"{request.target_server}:{request.target_port} ({request.protocol.upper()})"
+        )
+
+    except ValueError as e:
+        return SyslogBatchResponse(
+            success=False,
+            error=str(e)
+        )
+    except ConnectionError as e:
+        return SyslogBatchResponse(
+            success=False,
+            error=f"Transmission error: {str(e)}"
+        )
+
+
 @router.post("/parse-only", response_model=SyslogResponse)
 async def parse_only(raw_message: str = Form(...),
                      rfc_version: str = Form("3164")) -> SyslogResponse:
@@ -90,7 +139,7 @@ async def parse_only(raw_message: str = Form(...),
     Returns:
         SyslogResponse: 파싱 성공 여부와 결과를 포함한 응답 객체입니다.
     """
-    print(f"Parse-only request: {raw_message}, RFC: {rfc_version}")
+    logger.debug("Parse-only request: %s, RFC: %s", raw_message, rfc_version)
 
     try:
         # Select parser based on RFC version
@@ -104,7 +153,7 @@ async def parse_only(raw_message: str = Form(...),
         )
 
     except ValueError as e:
-        print(f"Parse-only error: {e}")
+        logger.debug("Parse-only error: %s", e)
         return SyslogResponse(
             success=False,
             error=str(e)
@@ -125,7 +174,7 @@ async def generate_syslog(request: GenerateRequest) -> SyslogResponse:
     Returns:
         SyslogResponse: 생성 성공 여부, 파싱된 메시지, 생성된 메시지, 전송 정보를 포함한 응답
     """
-    print(f"Generate request: {request}")
+    logger.debug("Generate request: %s", request)
 
     try:
         generated_message = generator_service.generate(
@@ -149,17 +198,17 @@ async def generate_syslog(request: GenerateRequest) -> SyslogResponse:
             sent_to=f"{request.target_server}:{request.target_port} ({request.protocol.upper()})"
         )
 
-        print(f"Response: {response}")
+        logger.debug("Response: %s", response)
         return response
 
     except ValueError as e:
-        print(f"Generation error: {e}")
+        logger.debug("Generation error: %s", e)
         return SyslogResponse(
             success=False,
             error=str(e)
         )
     except ConnectionError as e:
-        print(f"Transmission error: {e}")
+        logger.warning("Transmission error: %s", e)
         return SyslogResponse(
             success=False,
             error=f"Transmission error: {str(e)}"
@@ -180,7 +229,7 @@ async def generate_only(components: MessageComponents) -> SyslogResponse:
     Returns:
         SyslogResponse: 생성 성공 여부와 결과 메시지 또는 에러 정보
     """
-    print(f"Generate-only request: {components}")
+    logger.debug("Generate-only request: %s", components)
 
     try:
         generated_message = generator_service.generate(
@@ -197,7 +246,7 @@ async def generate_only(components: MessageComponents) -> SyslogResponse:
         )
 
     except ValueError as e:
-        print(f"Generation error: {e}")
+        logger.debug("Generation error: %s", e)
         return SyslogResponse(
             success=False,
             error=str(e)
@@ -0,0 +1,107 @@
+"""
+sendmmsg(2) 바인딩 모듈.
+
+Linux의 sendmmsg 시스템 콜을 ctypes로 호출하여 연결된(connect된) UDP 소켓에서
+여러 데이터그램을 한 번의 시스템 콜로 전송합니다. 다른 플랫폼이나 libc에 sendmmsg가 없는
+경우 SENDMMSG_AVAILABLE이 False이며, 호출 측에서 sendto 반복으로 대체해야 합니다.
+"""
+import ctypes
+import os
+import sys
+from typing import List
+
+SENDMMSG_BATCH_SIZE = 1024
+"""한 번의 sendmmsg 호출로 전송하는 최대 데이터그램 수 (Linux UIO_MAXIOV)"""
+
+
+class _IOVec(ctypes.Structure):
+    """struct iovec"""
+
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    """struct msghdr"""
+
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    """struct mmsghdr"""
+
+    _fields_ = [
+        ("msg_hdr", _MsgHdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+def _load_sendmmsg():
+    """libc의 sendmmsg 함수를 찾아 반환합니다. 지원되지 않으면 None을 반환합니다."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int]
+    func.restype = ctypes.c_int
+    return func
+
+
+_sendmmsg = _load_sendmmsg()
+
+SENDMMSG_AVAILABLE = _sendmmsg is not None
+"""현재 플랫폼에서 sendmmsg를 사용할 수 있는지 여부"""
+
+
+def sendmmsg(fd: int, payloads: List[bytes]) -> int:
+    """연결된 UDP 소켓으로 여러 데이터그램을 한 번의 시스템 콜로 전송
+
+    payloads는 최대 SENDMMSG_BATCH_SIZE개까지 한 번에 전달되며, 커널이 일부만 전송한 경우
+    전송된 개수를 그대로 반환합니다. 나머지는 호출 측에서 다시 전송해야 합니다.
+
+    Args:
+        fd (int): connect된 UDP 소켓의 파일 디스크립터
+        payloads (List[bytes]): 전송할 데이터그램 목록
+
+    Raises:
+        OSError: sendmmsg 호출이 실패한 경우 (EAGAIN 포함)
+        RuntimeError: 현재 플랫폼에서 sendmmsg를 사용할 수 없는 경우
+
+    Returns:
+        int: 전송된 데이터그램 수
+    """
+    if _sendmmsg is None:
+        raise RuntimeError("sendmmsg is not available on this platform")
+
+    count = min(len(payloads), SENDMMSG_BATCH_SIZE)
+    if count == 0:
+        return 0
+
+    iovecs = (_IOVec * count)()
+    messages = (_MMsgHdr * count)()
+    for i in range(count):
+        payload = payloads[i]
+        # c_char_p는 bytes 버퍼를 복사하지 않고 가리키며, payloads가 호출 동안 버퍼를 유지한다
+        iovecs[i].iov_base = ctypes.cast(ctypes.c_char_p(payload), ctypes.c_void_p)
+        iovecs[i].iov_len = len(payload)
+        messages[i].msg_hdr.msg_iov = ctypes.pointer(iovecs[i])
+        messages[i].msg_hdr.msg_iovlen = 1
+
+    sent = _sendmmsg(fd, messages, count, 0)
+    if sent < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+    return sent
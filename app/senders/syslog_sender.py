@@ -3,13 +3,276 @@ Syslog 메시지 전송 모듈.
 
 이 모듈은 UDP 또는 TCP 프로토콜을 사용하여 syslog 메시지를 원격 서버로 전송하는 기능을 제공합니다.
 """
+import asyncio
+import logging
 import socket
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from app.core import settings
+from app.senders.sendmmsg import SENDMMSG_AVAILABLE, SENDMMSG_BATCH_SIZE, sendmmsg
+
+logger = logging.getLogger(__name__)
+
+
+def _to_bytes(message: Union[str, bytes]) -> bytes:
+    """전송할 메시지를 bytes로 변환한다. 이미 bytes인 경우 다시 인코딩하지 않는다."""
+    if isinstance(message, (bytes, bytearray)):
+        return bytes(message)
+    return message.encode('utf-8')
+
+
+class _UDPEndpointProtocol(asyncio.DatagramProtocol):
+    """캐시된 UDP 엔드포인트용 프로토콜. 전송로가 닫히면 캐시에서 제거한다."""
+
+    def __init__(self, key: Tuple[str, int]) -> None:
+        self.key = key
+        self.transport: Optional[asyncio.DatagramTransport] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if SyslogSender._udp_transports.get(self.key) is self.transport:
+            del SyslogSender._udp_transports[self.key]
 
 
 class SyslogSender:
     """Syslog message sender."""
+
+    _udp_transports: Dict[Tuple[str, int], asyncio.DatagramTransport] = {}
+    """(host, port)별로 재사용하는 UDP 데이터그램 전송로"""
+
+    _tcp_streams: Dict[Tuple[str, int], Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = {}
+    """(host, port)별로 재사용하는 TCP 연결의 (reader, writer)"""
+
+    _tcp_locks: Dict[Tuple[str, int], asyncio.Lock] = {}
+    """TCP 연결별 쓰기 순서를 보장하는 잠금"""
+
+    _addr_cache: Dict[Tuple[str, int, int], Tuple[float, Tuple[str, int]]] = {}
+    """(host, port, 소켓 타입)별 (만료 시각, 해석된 sockaddr) 캐시"""
+
+    _send_semaphores: Dict[Tuple[str, int], asyncio.Semaphore] = {}
+    """대상별 동시 전송 수를 MAX_CONCURRENCY로 제한하는 세마포어"""
+
+    _last_used: Dict[Tuple[str, int], float] = {}
+    """대상별 마지막 전송 시각 (time.monotonic)"""
+
+    _next_sweep = 0.0
+    """다음 유휴 연결 정리 시각 (time.monotonic)"""
+
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    """캐시된 전송로와 연결이 속한 이벤트 루프"""
+
+    MAX_CONCURRENCY = settings.sender_max_concurrency
+    """대상별 최대 동시 전송 수 (환경 변수 SENDER_MAX_CONCURRENCY)"""
+
+    TCP_CONNECT_TIMEOUT = 5.0
+    """TCP 연결 타임아웃 (초)"""
+
+    TCP_SNDBUF_SIZE = 256 * 1024
+    """TCP 송신 버퍼 크기 (바이트)"""
+
+    ADDR_CACHE_TTL = 300.0
+    """주소 해석 결과 캐시 유지 시간 (초)"""
+
+    IDLE_TIMEOUT = 30.0
+    """이 시간 동안 사용되지 않은 대상의 전송로와 연결을 닫는다 (초)"""
+
+    @classmethod
+    async def _resolve(cls, host: str, port: int, sock_type: int) -> Tuple[str, int]:
+        """대상 주소를 IPv4 sockaddr로 해석하고 ADDR_CACHE_TTL 동안 캐시
+
+        전송로를 새로 만들거나 TCP를 다시 연결할 때마다 이름 해석을 반복하지 않도록
+        loop.getaddrinfo 결과의 첫 번째 sockaddr을 캐시합니다.
+
+        Args:
+            host (str): 수신 호스트 주소 또는 이름
+            port (int): 수신 포트 번호
+            sock_type (int): socket.SOCK_DGRAM 또는 socket.SOCK_STREAM
+
+        Raises:
+            OSError: 주소를 해석할 수 없는 경우 (socket.gaierror)
+
+        Returns:
+            Tuple[str, int]: 해석된 (IP 주소, 포트)
+        """
+        key = (host, port, sock_type)
+        now = time.monotonic()
+        cached = cls._addr_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, family=socket.AF_INET, type=sock_type)
+        sockaddr = infos[0][4][:2]
+        cls._addr_cache[key] = (now + cls.ADDR_CACHE_TTL, sockaddr)
+        return sockaddr
+
+    @classmethod
+    def _tune_tcp_socket(cls, sock: Optional[socket.socket]) -> None:
+        """새로 연결된 TCP 소켓에 지연 감소용 옵션을 적용
+
+        작은 syslog 한 줄이 Nagle 알고리즘에 묶여 지연되지 않도록 TCP_NODELAY를 켜고,
+        송신 버퍼를 늘리며, 지원되는 플랫폼(Linux)에서는 TCP_QUICKACK도 켭니다.
+        연결당 한 번만 호출하며, 옵션 설정 실패는 전송에 영향을 주지 않으므로 무시합니다.
+
+        Args:
+            sock (Optional[socket.socket]): writer.get_extra_info('socket')로 얻은 소켓
+        """
+        if sock is None:
+            return
+        options = [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_SNDBUF, cls.TCP_SNDBUF_SIZE),
+        ]
+        if hasattr(socket, "TCP_QUICKACK"):
+            options.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+        for level, option, value in options:
+            try:
+                sock.setsockopt(level, option, value)
+            except OSError:
+                pass
+
+    @classmethod
+    @asynccontextmanager
+    async def _limit(cls, host: str, port: int) -> AsyncIterator[None]:
+        """대상별 세마포어로 동시 전송 수를 MAX_CONCURRENCY로 제한한다."""
+        cls._bind_loop()
+        key = (host, port)
+        cls._touch(key)
+        semaphore = cls._send_semaphores.get(key)
+        if semaphore is None:
+            semaphore = cls._send_semaphores[key] = asyncio.Semaphore(cls.MAX_CONCURRENCY)
+        async with semaphore:
+            yield
+
+    @classmethod
+    def _touch(cls, key: Tuple[str, int]) -> None:
+        """대상의 마지막 사용 시각을 갱신하고, IDLE_TIMEOUT마다 한 번 유휴 대상을 정리한다.
+
+        별도의 백그라운드 작업 없이 전송 경로에서 지연 방식으로 정리하므로,
+        전송이 없는 동안에는 아무 작업도 하지 않습니다.
+        전송로와 연결뿐 아니라 대상별 세마포어와 주소 해석 캐시도 함께 제거하여,
+        서로 다른 대상이 계속 바뀌어도 캐시가 무한히 커지지 않습니다.
+        """
+        now = time.monotonic()
+        cls._last_used[key] = now
+        if now < cls._next_sweep:
+            return
+        cls._next_sweep = now + cls.IDLE_TIMEOUT
+
+        for idle_key, last_used in list(cls._last_used.items()):
+            if now - last_used <= cls.IDLE_TIMEOUT:
+                continue
+            lock = cls._tcp_locks.get(idle_key)
+            if lock is not None and lock.locked():
+                # 아직 쓰기가 진행 중인 연결은 다음 정리 때 다시 확인한다
+                continue
+            del cls._last_used[idle_key]
+            cls._tcp_locks.pop(idle_key, None)
+            cls._send_semaphores.pop(idle_key, None)
+            cls._addr_cache.pop((*idle_key, socket.SOCK_DGRAM), None)
+            cls._addr_cache.pop((*idle_key, socket.SOCK_STREAM), None)
+            transport = cls._udp_transports.pop(idle_key, None)
+            if transport is not None:
+                transport.close()
+            stream = cls._tcp_streams.pop(idle_key, None)
+            if stream is not None:
+                stream[1].close()
+
+    @classmethod
+    def _bind_loop(cls) -> asyncio.AbstractEventLoop:
+        """현재 이벤트 루프를 반환하고, 루프가 바뀌었으면 이전 루프의 캐시를 정리한다."""
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop:
+            cls.close()
+            cls._loop = loop
+        return loop
+
+    @classmethod
+    async def _get_udp_transport(cls, host: str, port: int) -> asyncio.DatagramTransport:
+        """(host, port)에 연결된 UDP 전송로를 반환
+
+        전송로는 대상별로 한 번만 loop.create_datagram_endpoint로 생성하여 캐시하며,
+        대상 주소는 _resolve로 캐시된 해석 결과를 사용합니다.
+        이벤트 루프가 바뀐 경우 이전 루프의 전송로는 모두 닫고 새로 생성합니다.
+
+        Args:
+            host (str): 수신 호스트 주소
+            port (int): 수신 포트 번호
+
+        Returns:
+            asyncio.DatagramTransport: 캐시된 UDP 전송로
+        """
+        loop = cls._bind_loop()
+
+        key = (host, port)
+        transport = cls._udp_transports.get(key)
+        if transport is None or transport.is_closing():
+            remote_addr = await cls._resolve(host, port, socket.SOCK_DGRAM)
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: _UDPEndpointProtocol(key),
+                remote_addr=remote_addr, family=socket.AF_INET)
+            # 생성을 기다리는 동안 다른 요청이 먼저 등록했다면 그것을 사용한다
+            cached = cls._udp_transports.get(key)
+            if cached is not None and not cached.is_closing():
+                transport.close()
+                return cached
+            cls._udp_transports[key] = transport
+        return transport
+
+    @classmethod
+    async def _get_tcp_writer(cls, host: str, port: int) -> asyncio.StreamWriter:
+        """(host, port)에 연결된 TCP writer를 반환
+
+        연결은 대상별로 한 번만 asyncio.open_connection으로 맺어 캐시하며,
+        상대가 연결을 닫았거나 writer가 닫히는 중이면 새로 연결합니다.
+        호출자는 해당 대상의 _tcp_locks 잠금을 잡은 상태여야 합니다.
+
+        Args:
+            host (str): 수신 호스트 주소
+            port (int): 수신 포트 번호
+
+        Returns:
+            asyncio.StreamWriter: 캐시된 TCP writer
+        """
+        key = (host, port)
+        stream = cls._tcp_streams.get(key)
+        if stream is not None:
+            reader, writer = stream
+            if not writer.is_closing() and not reader.at_eof():
+                return writer
+            writer.close()
+
+        remote_host, remote_port = await cls._resolve(host, port, socket.SOCK_STREAM)
+        _, writer = stream = await asyncio.wait_for(
+            asyncio.open_connection(remote_host, remote_port, family=socket.AF_INET),
+            timeout=cls.TCP_CONNECT_TIMEOUT)
+        cls._tune_tcp_socket(writer.get_extra_info('socket'))
+        cls._tcp_streams[key] = stream
+        return writer
+
+    @classmethod
+    def close(cls) -> None:
+        """캐시된 전송로와 연결을 모두 닫습니다. 애플리케이션 종료 시 호출합니다."""
+        transports = list(cls._udp_transports.values())
+        transports.extend(writer for _, writer in cls._tcp_streams.values())
+        cls._udp_transports.clear()
+        cls._tcp_streams.clear()
+        cls._tcp_locks.clear()
+        cls._send_semaphores.clear()
+        cls._last_used.clear()
+        for transport in transports:
+            try:
+                transport.close()
+            except RuntimeError:
+                # 이미 닫힌 이벤트 루프에 속한 전송로는 가비지 컬렉션 시 소켓이 정리된다
+                pass
+
     @staticmethod
-    async def send(protocol: str, message: str, host: str, port: int) -> None:
+    async def send(protocol: str, message: Union[str, bytes], host: str, port: int) -> None:
         """Syslog 메시지를 UDP 또는 TCP 프로토콜을 사용하여 전송
 
         주어진 프로토콜에 따라 적절한 전송 방식으로 메시지를 전송하며,
@@ -18,7 +281,7 @@ class SyslogSender:
 
         Args:
             protocol (str): 전송에 사용할 프로토콜 (udp 또는 tcp)
-            message (str): 전송할 syslog 메시지
+            message (Union[str, bytes]): 전송할 syslog 메시지. bytes는 그대로 전송한다
             host (str): 수신 호스트 주소
             port (int): 수신 포트 번호
 
@@ -33,14 +296,152 @@ class SyslogSender:
             raise ValueError("Protocol must be 'udp' or 'tcp'")
 
     @staticmethod
-    async def send_udp(message: str, host: str, port: int) -> bool:
+    async def send_many(protocol: str, messages: List[Union[str, bytes]], host: str, port: int) -> int:
+        """여러 Syslog 메시지를 UDP 또는 TCP 프로토콜로 한 번에 전송
+
+        send와 같은 방식으로 프로토콜을 선택하되, 메시지마다 전송 함수를 호출하지 않고
+        send_many_udp 또는 send_many_tcp로 묶어서 전송한다.
+
+        Args:
+            protocol (str): 전송에 사용할 프로토콜 (udp 또는 tcp)
+            messages (List[Union[str, bytes]]): 전송할 syslog 메시지 목록
+            host (str): 수신 호스트 주소
+            port (int): 수신 포트 번호
+
+        Raises:
+            ValueError: 지원되지 않는 프로토콜이 입력된 경우
+
+        Returns:
+            int: 전송한 메시지 수
+        """
+        if protocol == "udp":
+            return await SyslogSender.send_many_udp(messages, host, port)
+        if protocol == "tcp":
+            return await SyslogSender.send_many_tcp(messages, host, port)
+        raise ValueError("Protocol must be 'udp' or 'tcp'")
+
+    @staticmethod
+    async def send_many_udp(messages: List[Union[str, bytes]], host: str, port: int) -> int:
+        """여러 메시지를 UDP 데이터그램으로 전송
+
+        대상 전송로 조회는 한 번만 하고, 메시지마다 하나의 데이터그램을 보냅니다.
+        Linux에서는 sendmmsg(2)로 최대 SENDMMSG_BATCH_SIZE개씩 한 번의 시스템 콜로 전송하며,
+        소켓 버퍼가 가득 차거나(EAGAIN) sendmmsg를 쓸 수 없으면 남은 메시지는 전송로의
+        sendto로 보내 전송로의 버퍼링과 순서를 그대로 따릅니다.
+        수신 측이 닫혀 있어 ECONNREFUSED가 보고되면 send_udp의 전송로와 같이 오류로 취급하지
+        않고 해당 데이터그램만 버립니다.
+
+        Args:
+            messages (List[Union[str, bytes]]): 전송할 메시지 목록
+            host (str): 수신 호스트 주소
+            port (int): 수신 포트 번호
+
+        Raises:
+            ConnectionError: UDP 전송 실패 시 발생하는 예외
+
+        Returns:
+            int: 전송한 메시지 수
+        """
+        try:
+            async with SyslogSender._limit(host, port):
+                transport = await SyslogSender._get_udp_transport(host, port)
+                payloads = [_to_bytes(message) for message in messages]
+
+                offset = 0
+                sock = transport.get_extra_info('socket')
+                # 전송로에 대기 중인 데이터가 있으면 직접 쓰면 순서가 바뀌므로 sendmmsg를 쓰지 않는다
+                if SENDMMSG_AVAILABLE and sock is not None and transport.get_write_buffer_size() == 0:
+                    fd = sock.fileno()
+                    while offset < len(payloads):
+                        try:
+                            offset += sendmmsg(fd, payloads[offset:offset + SENDMMSG_BATCH_SIZE])
+                        except BlockingIOError:
+                            break
+                        except ConnectionRefusedError:
+                            # 이전 데이터그램의 ICMP port unreachable이 보고된 것이다. 전송로의
+                            # sendto와 같이 해당 데이터그램만 버리고 나머지는 계속 전송한다
+                            offset += 1
+
+                sendto = transport.sendto
+                for payload in payloads[offset:]:
+                    sendto(payload)
+            return len(payloads)
+
+        except (socket.error, OSError) as e:
+            raise ConnectionError(f"UDP send failed: {e}") from e
+
+    @staticmethod
+    async def send_many_tcp(messages: List[Union[str, bytes]], host: str, port: int) -> int:
+        """여러 메시지를 하나의 TCP 쓰기로 묶어서 전송
+
+        각 메시지를 send_tcp와 같은 LF 프레이밍으로 인코딩한 뒤 하나의 버퍼로 합쳐
+        캐시된 연결에 한 번 쓰고 한 번 drain하므로, 메시지 수와 관계없이 송신 시스템 콜이
+        버퍼 크기만큼으로 줄어듭니다.
+
+        Args:
+            messages (List[Union[str, bytes]]): 전송할 메시지 목록
+            host (str): 메시지를 전송할 호스트 주소
+            port (int): 메시지를 전송할 포트 번호
+
+        Raises:
+            ConnectionError: 소켓 연결 또는 전송 과정에서 오류가 발생한 경우
+
+        Returns:
+            int: 전송한 메시지 수
+        """
+        if not messages:
+            return 0
+        payload = b"".join(
+            encoded if encoded.endswith(b'\n') else encoded + b'\n'
+            for encoded in map(_to_bytes, messages)
+        )
+        await SyslogSender._write_tcp(payload, host, port)
+        return len(messages)
+
+    @staticmethod
+    async def _write_tcp(payload: bytes, host: str, port: int) -> None:
+        """캐시된 TCP 연결에 payload를 쓰고 drain
+
+        캐시된 연결이 끊어져 있었다면 한 번 다시 연결하여 재시도합니다.
+
+        Args:
+            payload (bytes): 프레이밍까지 끝난 전송 바이트
+            host (str): 메시지를 전송할 호스트 주소
+            port (int): 메시지를 전송할 포트 번호
+
+        Raises:
+            ConnectionError: 소켓 연결 또는 전송 과정에서 오류가 발생한 경우
+        """
+        try:
+            key = (host, port)
+            async with SyslogSender._limit(host, port), \
+                    SyslogSender._tcp_locks.setdefault(key, asyncio.Lock()):
+                writer = await SyslogSender._get_tcp_writer(host, port)
+                try:
+                    writer.write(payload)
+                    await writer.drain()
+                except ConnectionError:
+                    # 상대가 닫은 캐시 연결이면 새로 연결하여 한 번 재시도한다
+                    writer.close()
+                    SyslogSender._tcp_streams.pop(key, None)
+                    writer = await SyslogSender._get_tcp_writer(host, port)
+                    writer.write(payload)
+                    await writer.drain()
+
+        except (socket.error, OSError, asyncio.TimeoutError) as e:
+            raise ConnectionError(f"TCP send failed: {e}") from e
+
+    @staticmethod
+    async def send_udp(message: Union[str, bytes], host: str, port: int) -> bool:
         """UDP를 통해 메시지를 전송
 
         메시지를 지정된 호스트와 포트로 UDP 소켓을 사용하여 전송합니다. 전송 성공 시 True를 반환하고,
-        전송 중 오류가 발생하면 ConnectionError 예외를 발생시킵니다. 소켓은 전송 후 자동으로 닫힙니다.
+        전송 중 오류가 발생하면 ConnectionError 예외를 발생시킵니다.
+        소켓은 매번 생성/종료하지 않고 대상별로 캐시된 데이터그램 전송로를 재사용하며,
+        transport.sendto는 이벤트 루프를 막지 않습니다.
 
         Args:
-            message (str): 전송할 메시지 내용
+            message (Union[str, bytes]): 전송할 메시지 내용. bytes는 그대로 전송한다
             host (str): 수신 호스트 주소
             port (int): 수신 포트 번호
 
@@ -51,28 +452,29 @@ class SyslogSender:
             bool: 전송 성공 시 True, 실패 시 False를 반환하지만 실제로는 예외가 발생함
         """
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(5.0)
-
-            sock.sendto(message.encode('utf-8'), (host, port))
-            sock.close()
+            async with SyslogSender._limit(host, port):
+                transport = await SyslogSender._get_udp_transport(host, port)
+                transport.sendto(_to_bytes(message))
 
-            print(f"UDP message sent to {host}:{port}")
+            logger.debug("UDP message sent to %s:%s", host, port)
             return True
 
         except (socket.error, OSError) as e:
-            print(f"UDP send failed: {e}")
+            logger.debug("UDP send failed: %s", e)
             raise ConnectionError(f"UDP send failed: {e}") from e
 
     @staticmethod
-    async def send_tcp(message: str, host: str, port: int) -> bool:
+    async def send_tcp(message: Union[str, bytes], host: str, port: int) -> bool:
         """TCP를 통해 메시지를 전송
 
-        주어진 호스트와 포트로 TCP 소켓을 생성하여 메시지를 전송합니다. 전송 성공 시 True를 반환하고,
-        실패할 경우 ConnectionError 예외를 발생시킵니다. 소켓 연결 타임아웃은 5초로 설정됩니다.
+        주어진 호스트와 포트로 메시지를 전송합니다. 전송 성공 시 True를 반환하고,
+        실패할 경우 ConnectionError 예외를 발생시킵니다. 연결 타임아웃은 5초로 설정됩니다.
+        연결은 대상별로 캐시하여 재사용하므로 메시지마다 TCP 핸드셰이크를 하지 않으며,
+        한 연결에 여러 메시지가 이어지므로 RFC 6587 non-transparent framing에 따라 LF로 끝맺습니다.
+        캐시된 연결이 끊어져 있었다면 한 번 다시 연결하여 재시도합니다.
 
         Args:
-            message (str): 전송할 메시지 내용
+            message (Union[str, bytes]): 전송할 메시지 내용. bytes는 그대로 전송한다
             host (str): 메시지를 전송할 호스트 주소
             port (int): 메시지를 전송할 포트 번호
 
@@ -82,17 +484,16 @@ class SyslogSender:
         Returns:
             bool: 전송 성공 시 True, 실패 시 False
         """
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5.0)
+        payload = _to_bytes(message)
+        if not payload.endswith(b'\n'):
+            payload += b'\n'
 
-            sock.connect((host, port))
-            sock.send(message.encode('utf-8'))
-            sock.close()
+        try:
+            await SyslogSender._write_tcp(payload, host, port)
 
-            print(f"TCP message sent to {host}:{port}")
+            logger.debug("TCP message sent to %s:%s", host, port)
             return True
 
-        except (socket.error, OSError) as e:
-            print(f"TCP send failed: {e}")
-            raise ConnectionError(f"TCP send failed: {e}") from e
+        except ConnectionError as e:
+            logger.debug("TCP send failed: %s", e.__cause__ or e)
+            raise
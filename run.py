@@ -18,5 +18,7 @@ if __name__ == "__main__":
         app,
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        # 요청마다 접근 로그를 포맷하지 않도록 디버그 모드에서만 기록한다
+        access_log=settings.debug
     )
@@ -4,174 +4,257 @@
 UDP와 TCP 모두 지원하여 테스트 메시지를 받아 출력
 """
 import asyncio
-import socket
+import json
+import logging
+import sys
 import threading
-import time
+from collections import deque
 from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈로 저장한다
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def write_json(path: str, data: Any, default: Optional[Callable[[Any], Any]] = None):
+    """data를 JSON 파일로 저장합니다.
+
+    orjson이 설치되어 있으면 C 구현으로, 없으면 표준 json 모듈로 같은 형식(들여쓰기 2칸,
+    비ASCII 문자 유지)으로 직렬화한 뒤 바이트를 한 번에 기록합니다.
+
+    Args:
+        path (str): 저장할 파일 경로
+        data (Any): 저장할 데이터
+        default (Optional[Callable[[Any], Any]]): JSON으로 직렬화할 수 없는 값을 변환하는 함수
+    """
+    if orjson is not None:
+        blob = orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2)
+    else:
+        blob = json.dumps(data, ensure_ascii=False, indent=2, default=default).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(blob)
+
+
+class _UDPServerProtocol(asyncio.DatagramProtocol):
+    """수신한 데이터그램을 DebugSyslogServer로 전달하는 프로토콜"""
+
+    def __init__(self, server):
+        self.server = server
+
+    def datagram_received(self, data: bytes, addr):
+        self.server.handle_udp_message(data, addr)
 
 
 class DebugSyslogServer:
     """디버깅용 Syslog 서버 클래스"""
+
+    MAX_RECEIVED_MESSAGES = 100000
+    """보관하는 최근 메시지 최대 개수. 오래 실행해도 메모리 사용량이 제한된다"""
     
-    def __init__(self, host="127.0.0.1", port=5140):
+    def __init__(self, host="127.0.0.1", port=5140, reuse_port=False):
+        """
+        Args:
+            host (str): 수신할 주소
+            port (int): 수신할 UDP/TCP 포트
+            reuse_port (bool): SO_REUSEPORT로 바인딩합니다. 같은 포트에 여러 프로세스를 띄우면
+                커널이 수신 패킷과 연결을 프로세스들에 분산합니다 (Linux/BSD 전용).
+        """
         self.host = host
         self.port = port
+        self.reuse_port = reuse_port
         self.running = False
-        self.received_messages = []
-        self.udp_server = None
-        self.tcp_server = None
+        self.received_messages = deque(maxlen=self.MAX_RECEIVED_MESSAGES)
+        self._udp_count = 0
+        self._tcp_count = 0
+        self._lock = threading.Lock()
+        self._loop = None
+        self._stop_event = None
     
     def log_message(self, message: str, protocol: str, client: str):
         """받은 메시지를 로깅합니다."""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        # strftime + 슬라이스 대신 isoformat으로 같은 'YYYY-MM-DD HH:MM:SS.mmm' 형식을 만든다
+        timestamp = datetime.now().isoformat(' ', 'milliseconds')
         log_entry = {
             'timestamp': timestamp,
             'protocol': protocol,
             'client': client,
             'message': message
         }
-        self.received_messages.append(log_entry)
+        with self._lock:
+            self.received_messages.append(log_entry)
+            if protocol == 'UDP':
+                self._udp_count += 1
+            else:
+                self._tcp_count += 1
         
-        print(f"[{timestamp}] {protocol} from {client}:")
-        print(f"  -> {message}")
-        print()
+        logger.info("[%s] %s from %s:\n  -> %s\n", timestamp, protocol, client, message)
     
     def handle_udp_message(self, data: bytes, addr):
         """UDP 메시지를 처리합니다."""
         try:
-            message = data.decode('utf-8', errors='replace').strip()
+            # 대부분의 트래픽은 올바른 UTF-8이므로 errors='replace' 처리기는 실패했을 때만 사용한다
+            try:
+                message = data.decode().strip()
+            except UnicodeDecodeError:
+                message = data.decode('utf-8', errors='replace').strip()
             self.log_message(message, 'UDP', f"{addr[0]}:{addr[1]}")
         except Exception as e:
-            print(f"UDP message decode error: {e}")
+            logger.error("UDP message decode error: %s", e)
     
-    def handle_tcp_client(self, client_socket, addr):
-        """TCP 클라이언트를 처리합니다."""
+    async def handle_tcp_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """TCP 클라이언트를 처리합니다.
+
+        발신자는 연결을 재사용하며 메시지를 LF로 구분(RFC 6587)하므로 연결이 닫힐 때까지 줄 단위로 읽습니다.
+        """
+        addr = writer.get_extra_info('peername')
         try:
-            with client_socket:
-                data = client_socket.recv(1024)
-                if data:
-                    message = data.decode('utf-8', errors='replace').strip()
+            async for line in reader:
+                try:
+                    message = line.decode().strip()
+                except UnicodeDecodeError:
+                    message = line.decode('utf-8', errors='replace').strip()
+                if message:
                     self.log_message(message, 'TCP', f"{addr[0]}:{addr[1]}")
         except Exception as e:
-            print(f"TCP client handler error: {e}")
+            logger.error("TCP client handler error: %s", e)
+        finally:
+            writer.close()
     
-    def start_udp_server(self):
-        """UDP 서버를 시작합니다."""
+    async def serve(self):
+        """UDP와 TCP 서버를 하나의 이벤트 루프에서 실행하고, stop()이 호출될 때까지 대기합니다.
+
+        UDP는 loop.create_datagram_endpoint, TCP는 asyncio.start_server로 수신하므로
+        클라이언트별 스레드나 타임아웃 폴링이 필요 없습니다.
+        """
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._stop_event = asyncio.Event()
+        self.running = True
+
         try:
-            udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            udp_socket.bind((self.host, self.port))
-            udp_socket.settimeout(1.0)  # 1초 타임아웃
-            
-            print(f"UDP 서버가 {self.host}:{self.port}에서 시작되었습니다.")
-            
-            while self.running:
-                try:
-                    data, addr = udp_socket.recvfrom(1024)
-                    self.handle_udp_message(data, addr)
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    if self.running:
-                        print(f"UDP server error: {e}")
-                    break
-            
-            udp_socket.close()
-            print("UDP 서버가 종료되었습니다.")
-            
-        except Exception as e:
+            udp_transport, _ = await loop.create_datagram_endpoint(
+                lambda: _UDPServerProtocol(self),
+                local_addr=(self.host, self.port),
+                reuse_port=self.reuse_port or None)
+        except OSError as e:
             print(f"UDP 서버 시작 실패: {e}")
-    
-    def start_tcp_server(self):
-        """TCP 서버를 시작합니다."""
+            self.running = False
+            return
+        print(f"UDP 서버가 {self.host}:{self.port}에서 시작되었습니다.")
+
         try:
-            tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            tcp_socket.bind((self.host, self.port))
-            tcp_socket.listen(5)
-            tcp_socket.settimeout(1.0)  # 1초 타임아웃
-            
-            print(f"TCP 서버가 {self.host}:{self.port}에서 시작되었습니다.")
-            
-            while self.running:
-                try:
-                    client_socket, addr = tcp_socket.accept()
-                    # 새 스레드에서 클라이언트 처리
-                    client_thread = threading.Thread(
-                        target=self.handle_tcp_client, 
-                        args=(client_socket, addr)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    if self.running:
-                        print(f"TCP server error: {e}")
-                    break
-            
-            tcp_socket.close()
-            print("TCP 서버가 종료되었습니다.")
-            
-        except Exception as e:
+            tcp_server = await asyncio.start_server(
+                self.handle_tcp_client, self.host, self.port, reuse_address=True,
+                reuse_port=self.reuse_port or None)
+        except OSError as e:
             print(f"TCP 서버 시작 실패: {e}")
+            udp_transport.close()
+            self.running = False
+            return
+        print(f"TCP 서버가 {self.host}:{self.port}에서 시작되었습니다.")
+
+        try:
+            await self._stop_event.wait()
+        finally:
+            udp_transport.close()
+            print("UDP 서버가 종료되었습니다.")
+            tcp_server.close()
+            await tcp_server.wait_closed()
+            print("TCP 서버가 종료되었습니다.")
+            self.running = False
     
     def start(self):
-        """서버를 시작합니다."""
+        """서버를 백그라운드 스레드의 이벤트 루프에서 시작합니다."""
         if self.running:
             print("서버가 이미 실행 중입니다.")
             return
         
         self.running = True
         
-        # UDP 서버 스레드
-        udp_thread = threading.Thread(target=self.start_udp_server)
-        udp_thread.daemon = True
-        udp_thread.start()
-        
-        # TCP 서버 스레드
-        tcp_thread = threading.Thread(target=self.start_tcp_server)
-        tcp_thread.daemon = True
-        tcp_thread.start()
+        # 호출 측의 이벤트 루프와 독립적으로 동작하도록 전용 스레드에서 serve()를 실행한다
+        server_thread = threading.Thread(target=asyncio.run, args=(self.serve(),))
+        server_thread.daemon = True
+        server_thread.start()
         
         print(f"Debug Syslog 서버가 {self.host}:{self.port}에서 실행 중입니다.")
         print("Ctrl+C를 눌러 종료하세요.")
     
     def stop(self):
         """서버를 중지합니다."""
+        if self._loop is not None and self._stop_event is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료된 경우
+                pass
         self.running = False
         print("\n서버 종료 중...")
     
-    def get_received_messages(self):
-        """받은 메시지 목록을 반환합니다."""
-        return self.received_messages.copy()
+    @property
+    def total_received(self) -> int:
+        """지금까지 받은 메시지 수. get_received_messages의 다음 since 값으로 사용합니다."""
+        return self._udp_count + self._tcp_count
+
+    def get_received_messages(self, since: int = 0):
+        """받은 메시지 목록을 반환합니다.
+
+        since에 이전 호출 시점의 total_received를 넘기면 그 이후에 받은 메시지만 반환하므로,
+        주기적으로 조회하는 경우 전체 목록을 매번 복사하지 않고 새 메시지만큼만 처리합니다.
+        보관 한도(MAX_RECEIVED_MESSAGES)를 넘어 밀려난 메시지는 포함되지 않습니다.
+
+        Args:
+            since (int): 이미 받아 간 메시지 수. 기본값 0은 보관 중인 전체 메시지입니다.
+
+        Returns:
+            list: since 이후에 받은 메시지 목록 (오래된 순)
+        """
+        with self._lock:
+            count = min(self.total_received - since, len(self.received_messages))
+            if count <= 0:
+                return []
+            # deque의 뒤쪽에서 새 메시지만 꺼내므로 비용이 새 메시지 수에 비례한다
+            recent = list(islice(reversed(self.received_messages), count))
+        recent.reverse()
+        return recent
+    
+    def save_messages(self, path: str = "received_messages.json"):
+        """받은 메시지를 JSON 파일로 저장합니다."""
+        write_json(path, self.get_received_messages())
     
     def clear_messages(self):
         """받은 메시지를 초기화합니다."""
-        self.received_messages.clear()
+        with self._lock:
+            self.received_messages.clear()
+            self._udp_count = 0
+            self._tcp_count = 0
         print("받은 메시지가 초기화되었습니다.")
     
     def print_statistics(self):
-        """통계를 출력합니다."""
-        total = len(self.received_messages)
-        udp_count = len([m for m in self.received_messages if m['protocol'] == 'UDP'])
-        tcp_count = len([m for m in self.received_messages if m['protocol'] == 'TCP'])
-        
+        """통계를 출력합니다. 메시지 목록을 훑지 않고 수신 시 갱신한 카운터를 사용합니다."""
         print(f"\n=== 통계 ===")
-        print(f"총 받은 메시지: {total}")
-        print(f"UDP 메시지: {udp_count}")
-        print(f"TCP 메시지: {tcp_count}")
+        print(f"총 받은 메시지: {self._udp_count + self._tcp_count}")
+        print(f"UDP 메시지: {self._udp_count}")
+        print(f"TCP 메시지: {self._tcp_count}")
 
 
 def main():
-    """메인 함수"""
-    server = DebugSyslogServer()
+    """메인 함수
+
+    --reuse-port로 실행한 프로세스를 여러 개 띄우면 커널이 수신을 분산하므로
+    GIL에 묶이지 않고 수신 처리량을 늘릴 수 있습니다.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    server = DebugSyslogServer(reuse_port="--reuse-port" in sys.argv[1:])
     
     try:
-        server.start()
-        
-        while True:
-            time.sleep(1)
+        print(f"Debug Syslog 서버가 {server.host}:{server.port}에서 실행 중입니다.")
+        print("Ctrl+C를 눌러 종료하세요.")
+        asyncio.run(server.serve())
             
     except KeyboardInterrupt:
         server.stop()
@@ -179,9 +262,7 @@ def main():
         
         # 받은 메시지 저장
         if server.received_messages:
-            import json
-            with open("received_messages.json", "w", encoding="utf-8") as f:
-                json.dump(server.received_messages, f, ensure_ascii=False, indent=2)
+            server.save_messages("received_messages.json")
             print(f"받은 메시지가 'received_messages.json'에 저장되었습니다.")
 
 
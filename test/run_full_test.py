@@ -4,8 +4,8 @@
 디버그 서버를 시작하고 모든 테스트를 실행한 후 결과를 표시합니다.
 """
 import asyncio
-import time
-import threading
+import logging
+from collections import Counter
 import signal
 import sys
 from test.debug_syslog_server import DebugSyslogServer
@@ -27,6 +27,12 @@ class FullTestRunner:
         self.server.stop()
         sys.exit(0)
     
+    def request_shutdown(self, task: asyncio.Task):
+        """이벤트 루프에서 실행되는 SIGINT 핸들러. 실행 중인 테스트 태스크를 취소합니다."""
+        print("\n테스트 중단 요청을 받았습니다...")
+        self.running = False
+        task.cancel()
+    
     async def run_tests_with_server(self):
         """서버와 함께 테스트를 실행합니다."""
         print("="*60)
@@ -34,8 +40,13 @@ class FullTestRunner:
         print("="*60)
         print()
         
-        # 시그널 핸들러 등록
-        signal.signal(signal.SIGINT, self.signal_handler)
+        # 시그널 핸들러 등록. 이벤트 루프에 등록하면 태스크 취소로 중단되어 finally의 정리가 실행된다
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, self.request_shutdown, asyncio.current_task())
+        except NotImplementedError:
+            # Windows 이벤트 루프는 add_signal_handler를 지원하지 않는다
+            signal.signal(signal.SIGINT, self.signal_handler)
         
         try:
             # 디버그 서버 시작
@@ -62,14 +73,19 @@ class FullTestRunner:
                 print(f"\n서버가 받은 메시지 총 {len(received_messages)}개:")
                 print("-" * 60)
                 
+                # 메시지마다 print하지 않고 전체 출력을 만들어 한 번에 출력한다
+                entries = []
                 for i, msg in enumerate(received_messages, 1):
-                    print(f"[{i}] {msg['timestamp']} - {msg['protocol']} from {msg['client']}")
-                    print(f"    {msg['message'][:100]}{'...' if len(msg['message']) > 100 else ''}")
-                    print()
+                    message = msg['message']
+                    ellipsis = '...' if len(message) > 100 else ''
+                    entries.append(f"[{i}] {msg['timestamp']} - {msg['protocol']} from {msg['client']}\n"
+                                   f"    {message[:100]}{ellipsis}\n")
+                print("\n".join(entries))
                 
-                # 프로토콜별 통계
-                udp_count = len([m for m in received_messages if m['protocol'] == 'UDP'])
-                tcp_count = len([m for m in received_messages if m['protocol'] == 'TCP'])
+                # 프로토콜별 통계 (한 번 순회로 집계)
+                protocol_counts = Counter(m['protocol'] for m in received_messages)
+                udp_count = protocol_counts['UDP']
+                tcp_count = protocol_counts['TCP']
                 
                 print(f"UDP 메시지: {udp_count}개")
                 print(f"TCP 메시지: {tcp_count}개")
@@ -89,7 +105,7 @@ class FullTestRunner:
             # 테스트 결과 요약
             test_results = self.tester.test_results
             total = len(test_results)
-            success = len([r for r in test_results if r["status"] == "SUCCESS"])
+            success = sum(1 for r in test_results if r["status"] == "SUCCESS")
             
             print(f"총 테스트: {total}개")
             print(f"성공: {success}개")
@@ -105,11 +121,12 @@ class FullTestRunner:
             print("✅ test_results.json - 테스트 결과")
             
             if received_messages:
-                import json
-                with open("received_messages.json", "w", encoding="utf-8") as f:
-                    json.dump(received_messages, f, ensure_ascii=False, indent=2)
+                await asyncio.to_thread(self.server.save_messages, "received_messages.json")
                 print("✅ received_messages.json - 서버가 받은 메시지")
             
+        except asyncio.CancelledError:
+            print("테스트가 중단되었습니다.")
+            
         except Exception as e:
             print(f"테스트 실행 중 오류 발생: {e}")
             
@@ -136,13 +153,14 @@ class FullTestRunner:
             
             self.tester.test_priority_calculation()
             self.tester.test_timestamp_formats()
-            self.tester.generate_test_report()
+            await self.tester.generate_test_report()
         
         asyncio.run(quick_test())
 
 
 def main():
     """메인 함수"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     runner = FullTestRunner()
     
     print("Syslog 테스트 실행기")
@@ -4,14 +4,130 @@ RFC 3164/5424 Syslog 테스트 코드
 UI를 통해 다양한 syslog 메시지를 생성하고 검증하는 테스트 스크립트
 """
 import asyncio
-import json
-import time
+import re
 from datetime import datetime
-from typing import Dict, List, Any
-from app.models.syslog import MessageComponents
+from typing import Any, Dict, List, Tuple
+
+from pydantic import BaseModel
+
+from app.models.syslog import MessageComponents, RFC3164SyslogMessage, RFC5424SyslogMessage
 from app.parsers import parse_service
 from app.generators import generator_service
 from app.senders.syslog_sender import SyslogSender
+from debug_syslog_server import write_json
+
+_RFC3164_TS_RE = re.compile(r'<\d+>\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}', re.ASCII)
+"""RFC 3164 메시지 앞부분의 PRI와 타임스탬프 패턴 (예: <134>Oct 11 22:14:15)"""
+
+_RFC5424_TS_RE = re.compile(r'<\d+>1 \d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z', re.ASCII)
+"""RFC 5424 메시지의 PRI, VERSION과 타임스탬프 패턴 (예: <134>1 2003-10-11T22:14:15.003Z)"""
+
+_RFC3164_CASES: Tuple[MessageComponents, ...] = (
+    # 기본 RFC 3164 메시지
+    MessageComponents(
+        rfc_version="3164",
+        facility=16,  # local0
+        severity=6,   # info
+        hostname="test-server",
+        tag="testapp",
+        pid=1234,
+        message="Basic RFC 3164 test message"
+    ),
+    # 높은 우선순위 메시지
+    MessageComponents(
+        rfc_version="3164",
+        facility=4,   # security
+        severity=1,   # alert
+        hostname="security-server",
+        tag="auth",
+        pid=5678,
+        message="Security alert: Failed authentication attempt"
+    ),
+    # 시스템 메시지
+    MessageComponents(
+        rfc_version="3164",
+        facility=0,   # kernel
+        severity=3,   # error
+        hostname="kernel-server",
+        tag="kernel",
+        message="System error: Memory allocation failed"
+    ),
+    # 긴 메시지
+    MessageComponents(
+        rfc_version="3164",
+        facility=16,  # local0
+        severity=6,   # info
+        hostname="app-server",
+        tag="longmsg",
+        pid=9999,
+        message="This is a very long message to test the RFC 3164 format handling of extended content. " +
+               "It contains multiple sentences and should be properly formatted according to the standard. " +
+               "This helps verify that our implementation can handle messages of various lengths correctly."
+    ),
+)
+"""RFC 3164 테스트 케이스. MessageComponents는 frozen 모델이므로 import 시 한 번 만들어 공유한다"""
+
+_RFC5424_CASES: Tuple[MessageComponents, ...] = (
+    # 기본 RFC 5424 메시지
+    MessageComponents(
+        rfc_version="5424",
+        facility=16,  # local0
+        severity=6,   # info
+        hostname="test-server",
+        app_name="testapp",
+        proc_id="1234",
+        msg_id="MSG001",
+        structured_data="[exampleSDID@32473 iut=\"3\" eventSource=\"Application\" eventID=\"1011\"]",
+        message="Basic RFC 5424 test message"
+    ),
+    # 구조화된 데이터가 있는 메시지
+    MessageComponents(
+        rfc_version="5424",
+        facility=4,   # security
+        severity=2,   # critical
+        hostname="security-server",
+        app_name="auth-service",
+        proc_id="5678",
+        msg_id="AUTH-FAIL",
+        structured_data="[auth@32473 user=\"admin\" ip=\"192.168.1.100\" attempts=\"5\"]",
+        message="Authentication failure detected"
+    ),
+    # 다중 구조화된 데이터
+    MessageComponents(
+        rfc_version="5424",
+        facility=16,  # local0
+        severity=4,   # warning
+        hostname="metrics-server",
+        app_name="monitoring",
+        proc_id="worker-01",
+        msg_id="METRIC",
+        structured_data="[metrics@32473 cpu=\"85.5\" memory=\"78.2\"][alert@32473 threshold=\"80\" status=\"warning\"]",
+        message="System metrics threshold exceeded"
+    ),
+    # 구조화된 데이터 없는 메시지
+    MessageComponents(
+        rfc_version="5424",
+        facility=1,   # mail
+        severity=6,   # info
+        hostname="mail-server",
+        app_name="postfix",
+        proc_id="smtp[2345]",
+        msg_id="DELIVERED",
+        structured_data="-",
+        message="Email delivered successfully to user@example.com"
+    ),
+)
+"""RFC 5424 테스트 케이스"""
+
+
+def _json_default(obj: Any) -> Any:
+    """결과 저장 시 JSON으로 직렬화할 수 없는 값을 변환합니다.
+
+    파싱 결과는 모델 객체 그대로 보관했다가 리포트를 저장할 때 한 번만 dict로 변환합니다.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
 
 
 class SyslogTester:
@@ -24,9 +140,7 @@ class SyslogTester:
     
     def print_header(self, title: str):
         """테스트 헤더를 출력합니다."""
-        print(f"\n{'='*60}")
-        print(f"  {title}")
-        print(f"{'='*60}")
+        print(f"\n{'='*60}\n  {title}\n{'='*60}")
     
     def print_test_case(self, case_name: str):
         """테스트 케이스 헤더를 출력합니다."""
@@ -34,112 +148,11 @@ class SyslogTester:
     
     def create_rfc3164_test_cases(self) -> List[MessageComponents]:
         """RFC 3164 테스트 케이스들을 생성합니다."""
-        test_cases = []
-        
-        # 기본 RFC 3164 메시지
-        test_cases.append(MessageComponents(
-            rfc_version="3164",
-            facility=16,  # local0
-            severity=6,   # info
-            hostname="test-server",
-            tag="testapp",
-            pid=1234,
-            message="Basic RFC 3164 test message"
-        ))
-        
-        # 높은 우선순위 메시지
-        test_cases.append(MessageComponents(
-            rfc_version="3164",
-            facility=4,   # security
-            severity=1,   # alert
-            hostname="security-server",
-            tag="auth",
-            pid=5678,
-            message="Security alert: Failed authentication attempt"
-        ))
-        
-        # 시스템 메시지
-        test_cases.append(MessageComponents(
-            rfc_version="3164",
-            facility=0,   # kernel
-            severity=3,   # error
-            hostname="kernel-server",
-            tag="kernel",
-            message="System error: Memory allocation failed"
-        ))
-        
-        # 긴 메시지
-        test_cases.append(MessageComponents(
-            rfc_version="3164",
-            facility=16,  # local0
-            severity=6,   # info
-            hostname="app-server",
-            tag="longmsg",
-            pid=9999,
-            message="This is a very long message to test the RFC 3164 format handling of extended content. " +
-                   "It contains multiple sentences and should be properly formatted according to the standard. " +
-                   "This helps verify that our implementation can handle messages of various lengths correctly."
-        ))
-        
-        return test_cases
+        return list(_RFC3164_CASES)
     
     def create_rfc5424_test_cases(self) -> List[MessageComponents]:
         """RFC 5424 테스트 케이스들을 생성합니다."""
-        test_cases = []
-        
-        # 기본 RFC 5424 메시지
-        test_cases.append(MessageComponents(
-            rfc_version="5424",
-            facility=16,  # local0
-            severity=6,   # info
-            hostname="test-server",
-            app_name="testapp",
-            proc_id="1234",
-            msg_id="MSG001",
-            structured_data="[exampleSDID@32473 iut=\"3\" eventSource=\"Application\" eventID=\"1011\"]",
-            message="Basic RFC 5424 test message"
-        ))
-        
-        # 구조화된 데이터가 있는 메시지
-        test_cases.append(MessageComponents(
-            rfc_version="5424",
-            facility=4,   # security
-            severity=2,   # critical
-            hostname="security-server",
-            app_name="auth-service",
-            proc_id="5678",
-            msg_id="AUTH-FAIL",
-            structured_data="[auth@32473 user=\"admin\" ip=\"192.168.1.100\" attempts=\"5\"]",
-            message="Authentication failure detected"
-        ))
-        
-        # 다중 구조화된 데이터
-        test_cases.append(MessageComponents(
-            rfc_version="5424",
-            facility=16,  # local0
-            severity=4,   # warning
-            hostname="metrics-server",
-            app_name="monitoring",
-            proc_id="worker-01",
-            msg_id="METRIC",
-            structured_data="[metrics@32473 cpu=\"85.5\" memory=\"78.2\"][alert@32473 threshold=\"80\" status=\"warning\"]",
-            message="System metrics threshold exceeded"
-        ))
-        
-        # 구조화된 데이터 없는 메시지
-        test_cases.append(MessageComponents(
-            rfc_version="5424",
-            facility=1,   # mail
-            severity=6,   # info
-            hostname="mail-server",
-            app_name="postfix",
-            proc_id="smtp[2345]",
-            msg_id="DELIVERED",
-            structured_data="-",
-            message="Email delivered successfully to user@example.com"
-        ))
-        
-        return test_cases
+        return list(_RFC5424_CASES)
     
     async def test_message_generation_and_parsing(self, test_cases: List[MessageComponents], rfc_version: str):
         """메시지 생성 및 파싱 테스트를 수행합니다."""
@@ -162,18 +175,20 @@ class SyslogTester:
                 print(f"  - Timestamp: {parsed_message.timestamp}")
                 print(f"  - Hostname: {parsed_message.hostname}")
                 
-                if rfc_version == "3164" and hasattr(parsed_message, 'tag'):
+                # 모델 타입으로 필드 존재가 정해지므로 hasattr 검사 없이 바로 읽는다
+                if isinstance(parsed_message, RFC3164SyslogMessage):
                     print(f"  - Tag: {parsed_message.tag}")
                     if parsed_message.pid:
                         print(f"  - PID: {parsed_message.pid}")
-                elif rfc_version == "5424":
-                    if hasattr(parsed_message, 'app_name') and parsed_message.app_name:
+                elif isinstance(parsed_message, RFC5424SyslogMessage):
+                    if parsed_message.app_name:
                         print(f"  - App Name: {parsed_message.app_name}")
-                    if hasattr(parsed_message, 'proc_id') and parsed_message.proc_id:
-                        print(f"  - Proc ID: {parsed_message.proc_id}")
-                    if hasattr(parsed_message, 'msg_id') and parsed_message.msg_id:
+                    # RFC 5424의 PROCID는 모델의 pid 필드에 저장된다
+                    if parsed_message.pid:
+                        print(f"  - Proc ID: {parsed_message.pid}")
+                    if parsed_message.msg_id:
                         print(f"  - Msg ID: {parsed_message.msg_id}")
-                    if hasattr(parsed_message, 'structured_data') and parsed_message.structured_data:
+                    if parsed_message.structured_data:
                         print(f"  - Structured Data: {parsed_message.structured_data}")
                 
                 print(f"  - Message: {parsed_message.message}")
@@ -183,7 +198,7 @@ class SyslogTester:
                     "test_case": f"RFC {rfc_version} Case {i}",
                     "status": "SUCCESS",
                     "generated_message": generated_message,
-                    "parsed_data": parsed_message.model_dump()
+                    "parsed_data": parsed_message
                 })
                 
                 print("✅ 테스트 성공")
@@ -197,9 +212,14 @@ class SyslogTester:
                 })
     
     async def test_message_transmission(self, test_cases: List[MessageComponents], rfc_version: str):
-        """메시지 전송 테스트를 수행합니다."""
+        """메시지 전송 테스트를 수행합니다.
+
+        전송할 메시지를 먼저 모두 생성한 뒤 SyslogSender.send_many로 프로토콜별 한 번에 전송합니다.
+        UDP는 sendmmsg(2)로 한 번의 시스템 콜에 묶이고, TCP는 LF 프레이밍된 메시지를 한 번에 씁니다.
+        """
         self.print_header(f"RFC {rfc_version} 메시지 전송 테스트")
         
+        messages = []
         for i, components in enumerate(test_cases[:2], 1):  # 처음 2개 케이스만 전송 테스트
             self.print_test_case(f"Transmission Test {i}")
             
@@ -207,34 +227,49 @@ class SyslogTester:
                 # 메시지 생성
                 generated_message = generator_service.generate(rfc_version, components)
                 print(f"전송할 메시지: {generated_message}")
+                messages.append((i, generated_message))
                 
-                # UDP로 전송 테스트
-                print(f"UDP로 {self.server}:{self.port}에 전송 중...")
-                await SyslogSender.send("udp", generated_message, self.server, self.port)
-                print("✅ UDP 전송 성공")
-                
-                time.sleep(0.1)  # 짧은 지연
-                
-                # TCP로 전송 테스트
-                print(f"TCP로 {self.server}:{self.port}에 전송 중...")
-                await SyslogSender.send("tcp", generated_message, self.server, self.port)
-                print("✅ TCP 전송 성공")
-                
-                # 결과 저장
+            except Exception as e:
+                print(f"❌ 메시지 생성 실패: {str(e)}")
                 self.test_results.append({
                     "test_case": f"RFC {rfc_version} Transmission {i}",
-                    "status": "SUCCESS",
-                    "message": generated_message,
-                    "target": f"{self.server}:{self.port}"
+                    "status": "FAILED",
+                    "error": str(e)
                 })
-                
-            except Exception as e:
-                print(f"❌ 전송 실패: {str(e)}")
+        
+        if not messages:
+            return
+        
+        payloads = [message for _, message in messages]
+        try:
+            # UDP로 일괄 전송 테스트
+            print(f"UDP로 {self.server}:{self.port}에 {len(payloads)}개 일괄 전송 중...")
+            await SyslogSender.send_many("udp", payloads, self.server, self.port)
+            print("✅ UDP 전송 성공")
+            
+            # TCP로 일괄 전송 테스트
+            print(f"TCP로 {self.server}:{self.port}에 {len(payloads)}개 일괄 전송 중...")
+            await SyslogSender.send_many("tcp", payloads, self.server, self.port)
+            print("✅ TCP 전송 성공")
+            
+        except Exception as e:
+            print(f"❌ 전송 실패: {str(e)}")
+            for i, _ in messages:
                 self.test_results.append({
                     "test_case": f"RFC {rfc_version} Transmission {i}",
                     "status": "FAILED",
                     "error": str(e)
                 })
+            return
+        
+        # 결과 저장
+        for i, generated_message in messages:
+            self.test_results.append({
+                "test_case": f"RFC {rfc_version} Transmission {i}",
+                "status": "SUCCESS",
+                "message": generated_message,
+                "target": f"{self.server}:{self.port}"
+            })
     
     def test_priority_calculation(self):
         """우선순위 계산 테스트를 수행합니다."""
@@ -312,9 +347,7 @@ class SyslogTester:
             print(f"RFC 3164 메시지: {generated_message}")
             
             # 타임스탬프 패턴 확인 (예: Oct 11 22:14:15)
-            import re
-            rfc3164_pattern = r'<\d+>\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}'
-            if re.match(rfc3164_pattern, generated_message):
+            if _RFC3164_TS_RE.match(generated_message):
                 print("✅ RFC 3164 타임스탬프 형식 올바름")
                 status = "SUCCESS"
             else:
@@ -347,8 +380,7 @@ class SyslogTester:
             print(f"RFC 5424 메시지: {generated_message}")
             
             # 타임스탬프 패턴 확인 (예: 2003-10-11T22:14:15.003Z)
-            rfc5424_pattern = r'<\d+>1 \d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z'
-            if re.search(rfc5424_pattern, generated_message):
+            if _RFC5424_TS_RE.search(generated_message):
                 print("✅ RFC 5424 타임스탬프 형식 올바름")
                 status = "SUCCESS"
             else:
@@ -364,12 +396,63 @@ class SyslogTester:
         except Exception as e:
             print(f"❌ RFC 5424 타임스탬프 테스트 실패: {str(e)}")
     
-    def generate_test_report(self):
-        """테스트 결과 리포트를 생성합니다."""
+    def test_auto_version_detection(self):
+        """rfc_version "auto"의 헤더 기반 버전 판별 테스트를 수행합니다."""
+        self.print_header("RFC 버전 자동 판별 테스트")
+
+        messages = [
+            (generator_service.generate("3164", _RFC3164_CASES[0]), RFC3164SyslogMessage),
+            (generator_service.generate("5424", _RFC5424_CASES[0]), RFC5424SyslogMessage),
+        ]
+
+        for i, (message, expected_type) in enumerate(messages, 1):
+            self.print_test_case(f"Auto Detection {i}")
+            try:
+                parsed_message = parse_service.parse("auto", message)
+                print(f"메시지: {message}")
+                print(f"예상 형식: {expected_type.__name__}, 실제 형식: {type(parsed_message).__name__}")
+                status = "SUCCESS" if isinstance(parsed_message, expected_type) else "FAILED"
+                print("✅ 버전 판별 정확" if status == "SUCCESS" else "❌ 버전 판별 오류")
+                self.test_results.append({
+                    "test_case": f"Auto Version Detection {i}",
+                    "status": status,
+                    "message": message
+                })
+            except Exception as e:
+                print(f"❌ 테스트 실패: {str(e)}")
+                self.test_results.append({
+                    "test_case": f"Auto Version Detection {i}",
+                    "status": "FAILED",
+                    "error": str(e)
+                })
+
+        # 두 형식이 섞인 배치도 메시지마다 판별되어야 한다
+        self.print_test_case("Auto Detection Batch")
+        try:
+            parsed_messages = parse_service.parse_many("auto", [m for m, _ in messages])
+            ok = all(isinstance(p, t) for p, (_, t) in zip(parsed_messages, messages))
+            print("✅ 혼합 배치 판별 정확" if ok else "❌ 혼합 배치 판별 오류")
+            self.test_results.append({
+                "test_case": "Auto Version Detection Batch",
+                "status": "SUCCESS" if ok else "FAILED"
+            })
+        except Exception as e:
+            print(f"❌ 테스트 실패: {str(e)}")
+            self.test_results.append({
+                "test_case": "Auto Version Detection Batch",
+                "status": "FAILED",
+                "error": str(e)
+            })
+
+    async def generate_test_report(self):
+        """테스트 결과 리포트를 생성합니다.
+
+        결과 파일의 직렬화와 기록은 작업 스레드에서 수행하여 이벤트 루프를 막지 않습니다.
+        """
         self.print_header("테스트 결과 리포트")
         
         total_tests = len(self.test_results)
-        successful_tests = len([r for r in self.test_results if r["status"] == "SUCCESS"])
+        successful_tests = sum(1 for r in self.test_results if r["status"] == "SUCCESS")
         failed_tests = total_tests - successful_tests
         
         print(f"총 테스트 수: {total_tests}")
@@ -384,8 +467,7 @@ class SyslogTester:
                     print(f"  - {result['test_case']}: {result.get('error', 'Unknown error')}")
         
         # JSON 형태로 결과 저장
-        with open("test_results.json", "w", encoding="utf-8") as f:
-            json.dump(self.test_results, f, ensure_ascii=False, indent=2, default=str)
+        await asyncio.to_thread(write_json, "test_results.json", self.test_results, _json_default)
         
         print(f"\n상세 테스트 결과가 'test_results.json' 파일에 저장되었습니다.")
     
@@ -395,22 +477,28 @@ class SyslogTester:
         print(f"테스트 서버: {self.server}:{self.port}")
         print(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        # RFC 3164 테스트
-        rfc3164_cases = self.create_rfc3164_test_cases()
-        await self.test_message_generation_and_parsing(rfc3164_cases, "3164")
-        await self.test_message_transmission(rfc3164_cases, "3164")
-        
-        # RFC 5424 테스트
-        rfc5424_cases = self.create_rfc5424_test_cases()
-        await self.test_message_generation_and_parsing(rfc5424_cases, "5424")
-        await self.test_message_transmission(rfc5424_cases, "5424")
+        # 전송 테스트는 SyslogSender가 캐시한 TCP 연결 하나를 재사용하므로, 끝나면 이벤트 루프가
+        # 살아 있는 동안 닫는다
+        try:
+            # RFC 3164 테스트
+            rfc3164_cases = self.create_rfc3164_test_cases()
+            await self.test_message_generation_and_parsing(rfc3164_cases, "3164")
+            await self.test_message_transmission(rfc3164_cases, "3164")
+            
+            # RFC 5424 테스트
+            rfc5424_cases = self.create_rfc5424_test_cases()
+            await self.test_message_generation_and_parsing(rfc5424_cases, "5424")
+            await self.test_message_transmission(rfc5424_cases, "5424")
+        finally:
+            SyslogSender.close()
         
         # 추가 테스트
         self.test_priority_calculation()
         self.test_timestamp_formats()
+        self.test_auto_version_detection()
         
         # 결과 리포트 생성
-        self.generate_test_report()
+        await self.generate_test_report()
 
 
 async def main():
@@ -5,13 +5,23 @@ UI 기반 Syslog 테스트 도구
 """
 import asyncio
 import json
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
-from app.models.syslog import MessageComponents
+from pydantic import BaseModel
+
+from app.models.syslog import MessageComponents, RFC3164SyslogMessage, RFC5424SyslogMessage
 from app.parsers import parse_service
 from app.generators import generator_service
 from app.senders.syslog_sender import SyslogSender
+from debug_syslog_server import write_json
+
+
+def _json_default(obj):
+    """히스토리에 모델 객체로 보관한 파싱 결과를 저장 시점에 dict로 변환합니다."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class UITestTool:
@@ -22,9 +32,7 @@ class UITestTool:
     
     def print_header(self, title: str):
         """헤더를 출력합니다."""
-        print(f"\n{'='*60}")
-        print(f"  {title}")
-        print(f"{'='*60}")
+        print(f"\n{'='*60}\n  {title}\n{'='*60}")
     
     def print_menu(self):
         """메뉴를 출력합니다."""
@@ -39,40 +47,42 @@ class UITestTool:
         print()
     
     def get_user_input(self, prompt: str, default: str = "", required: bool = True) -> str:
-        """사용자 입력을 받습니다."""
+        """사용자 입력을 받습니다. 필수 항목이 비어 있으면 다시 입력받습니다."""
         if default:
             full_prompt = f"{prompt} (기본값: {default}): "
         else:
             full_prompt = f"{prompt}: "
         
-        value = input(full_prompt).strip()
-        
-        if not value and default:
-            return default
-        elif not value and required:
+        while True:
+            value = input(full_prompt).strip()
+            
+            if value:
+                return value
+            if default:
+                return default
+            if not required:
+                return ""
             print("필수 입력 항목입니다.")
-            return self.get_user_input(prompt, default, required)
-        
-        return value
     
     def get_int_input(self, prompt: str, min_val: int = 0, max_val: int = 999999, default: Optional[int] = None) -> Optional[int]:
-        """정수 입력을 받습니다."""
+        """정수 입력을 받습니다. 범위를 벗어나거나 숫자가 아니면 다시 입력받습니다."""
         default_str = str(default) if default is not None else ""
-        value_str = self.get_user_input(prompt, default_str, required=default is None)
-        
-        if not value_str and default is not None:
-            return default
         
-        try:
-            value = int(value_str)
+        while True:
+            value_str = self.get_user_input(prompt, default_str, required=default is None)
+            
+            if not value_str and default is not None:
+                return default
+            
+            try:
+                value = int(value_str)
+            except ValueError:
+                print("올바른 숫자를 입력해주세요.")
+                continue
+            
             if min_val <= value <= max_val:
                 return value
-            else:
-                print(f"값은 {min_val}에서 {max_val} 사이여야 합니다.")
-                return self.get_int_input(prompt, min_val, max_val, default)
-        except ValueError:
-            print("올바른 숫자를 입력해주세요.")
-            return self.get_int_input(prompt, min_val, max_val, default)
+            print(f"값은 {min_val}에서 {max_val} 사이여야 합니다.")
     
     def create_rfc3164_message(self) -> MessageComponents:
         """RFC 3164 메시지 구성 요소를 입력받습니다."""
@@ -128,8 +138,18 @@ class UITestTool:
             message=message
         )
     
-    async def test_message_generation(self, components: MessageComponents):
-        """메시지 생성 및 테스트를 수행합니다."""
+    async def test_message_generation(self, components: MessageComponents,
+                                      ask_transmission: bool = True) -> Optional[str]:
+        """메시지 생성 및 테스트를 수행합니다.
+
+        Args:
+            components (MessageComponents): 메시지 구성 요소
+            ask_transmission (bool): 생성 후 전송 테스트 여부를 묻습니다. 여러 메시지를 모아
+                한 번에 전송하는 호출 측은 False로 지정합니다.
+
+        Returns:
+            Optional[str]: 생성된 메시지. 실패하면 None
+        """
         print(f"\n--- RFC {components.rfc_version} 메시지 생성 및 테스트 ---")
         
         try:
@@ -141,46 +161,53 @@ class UITestTool:
             # 메시지 파싱
             print("\n2. 메시지 파싱 중...")
             parsed_message = parse_service.parse(components.rfc_version, generated_message)
-            print("파싱 결과:")
-            print(f"  - Priority: {parsed_message.priority}")
-            print(f"  - Facility: {parsed_message.facility}")
-            print(f"  - Severity: {parsed_message.severity}")
-            print(f"  - Timestamp: {parsed_message.timestamp}")
-            print(f"  - Hostname: {parsed_message.hostname}")
+            # 필드마다 print하지 않고 파싱 결과 전체를 모아 한 번에 출력한다
+            lines = [
+                "파싱 결과:",
+                f"  - Priority: {parsed_message.priority}",
+                f"  - Facility: {parsed_message.facility}",
+                f"  - Severity: {parsed_message.severity}",
+                f"  - Timestamp: {parsed_message.timestamp}",
+                f"  - Hostname: {parsed_message.hostname}",
+            ]
             
-            if components.rfc_version == "3164" and hasattr(parsed_message, 'tag'):
-                print(f"  - Tag: {parsed_message.tag}")
+            if isinstance(parsed_message, RFC3164SyslogMessage):
+                lines.append(f"  - Tag: {parsed_message.tag}")
+                if parsed_message.pid:
+                    lines.append(f"  - PID: {parsed_message.pid}")
+            elif isinstance(parsed_message, RFC5424SyslogMessage):
+                if parsed_message.app_name:
+                    lines.append(f"  - App Name: {parsed_message.app_name}")
+                # RFC 5424의 PROCID는 모델의 pid 필드에 저장된다
                 if parsed_message.pid:
-                    print(f"  - PID: {parsed_message.pid}")
-            elif components.rfc_version == "5424":
-                if hasattr(parsed_message, 'app_name') and parsed_message.app_name:
-                    print(f"  - App Name: {parsed_message.app_name}")
-                if hasattr(parsed_message, 'proc_id') and parsed_message.proc_id:
-                    print(f"  - Proc ID: {parsed_message.proc_id}")
-                if hasattr(parsed_message, 'msg_id') and parsed_message.msg_id:
-                    print(f"  - Msg ID: {parsed_message.msg_id}")
-                if hasattr(parsed_message, 'structured_data') and parsed_message.structured_data:
-                    print(f"  - Structured Data: {parsed_message.structured_data}")
+                    lines.append(f"  - Proc ID: {parsed_message.pid}")
+                if parsed_message.msg_id:
+                    lines.append(f"  - Msg ID: {parsed_message.msg_id}")
+                if parsed_message.structured_data:
+                    lines.append(f"  - Structured Data: {parsed_message.structured_data}")
             
-            print(f"  - Message: {parsed_message.message}")
+            lines.append(f"  - Message: {parsed_message.message}")
+            print("\n".join(lines))
             
             # 전송 테스트 여부 묻기
-            send_test = input("\n3. 전송 테스트를 수행하시겠습니까? (y/N): ").strip().lower()
-            
-            if send_test == 'y':
-                await self.test_message_transmission(generated_message)
+            if ask_transmission:
+                send_test = input("\n3. 전송 테스트를 수행하시겠습니까? (y/N): ").strip().lower()
+                
+                if send_test == 'y':
+                    await self.test_message_transmission([generated_message])
             
             # 히스토리에 저장
             test_record = {
                 "timestamp": datetime.now().isoformat(),
                 "rfc_version": components.rfc_version,
                 "generated_message": generated_message,
-                "parsed_data": parsed_message.model_dump(),
+                "parsed_data": parsed_message,
                 "status": "SUCCESS"
             }
             self.test_history.append(test_record)
             
             print("✅ 테스트 완료!")
+            return generated_message
             
         except Exception as e:
             print(f"❌ 테스트 실패: {str(e)}")
@@ -193,9 +220,13 @@ class UITestTool:
                 "error": str(e)
             }
             self.test_history.append(test_record)
+            return None
     
-    async def test_message_transmission(self, message: str):
-        """메시지 전송 테스트를 수행합니다."""
+    async def test_message_transmission(self, messages: List[str]):
+        """메시지 전송 테스트를 수행합니다.
+
+        프로토콜마다 SyslogSender.send_many로 메시지 전체를 한 번에 전송합니다.
+        """
         print("\n전송 설정:")
         server = self.get_user_input("서버 주소", "127.0.0.1")
         port = self.get_int_input("포트 번호", 1, 65535, 5140)
@@ -210,8 +241,8 @@ class UITestTool:
         
         for protocol in protocols:
             try:
-                print(f"\n{protocol.upper()}로 {server}:{port}에 전송 중...")
-                await SyslogSender.send(protocol, message, server, port)
+                print(f"\n{protocol.upper()}로 {server}:{port}에 {len(messages)}개 전송 중...")
+                await SyslogSender.send_many(protocol, messages, server, port)
                 print(f"✅ {protocol.upper()} 전송 성공")
             except Exception as e:
                 print(f"❌ {protocol.upper()} 전송 실패: {str(e)}")
@@ -236,9 +267,11 @@ class UITestTool:
         try:
             print(f"\nRFC {rfc_version}로 파싱 중...")
             parsed_message = parse_service.parse(rfc_version, raw_message)
+            # 출력과 히스토리 기록에 같은 dict를 사용한다
+            parsed_data = parsed_message.model_dump()
             
             print("파싱 결과:")
-            print(json.dumps(parsed_message.model_dump(), indent=2, ensure_ascii=False))
+            print(json.dumps(parsed_data, indent=2, ensure_ascii=False))
             
             # 히스토리에 저장
             test_record = {
@@ -246,7 +279,7 @@ class UITestTool:
                 "test_type": "raw_parsing",
                 "rfc_version": rfc_version,
                 "raw_message": raw_message,
-                "parsed_data": parsed_message.model_dump(),
+                "parsed_data": parsed_data,
                 "status": "SUCCESS"
             }
             self.test_history.append(test_record)
@@ -266,7 +299,7 @@ class UITestTool:
             }
             self.test_history.append(test_record)
     
-    def run_predefined_tests(self):
+    async def run_predefined_tests(self):
         """사전 정의된 테스트 케이스들을 실행합니다."""
         self.print_header("사전 정의된 테스트 케이스 실행")
         
@@ -307,13 +340,19 @@ class UITestTool:
         
         print(f"{len(test_cases)}개의 사전 정의된 테스트 케이스를 실행합니다...\n")
         
-        async def run_tests():
-            for i, components in enumerate(test_cases, 1):
-                print(f"--- 테스트 케이스 {i} (RFC {components.rfc_version}) ---")
-                await self.test_message_generation(components)
-                print()
+        generated_messages = []
+        for i, components in enumerate(test_cases, 1):
+            print(f"--- 테스트 케이스 {i} (RFC {components.rfc_version}) ---")
+            generated_message = await self.test_message_generation(components, ask_transmission=False)
+            if generated_message is not None:
+                generated_messages.append(generated_message)
+            print()
         
-        asyncio.run(run_tests())
+        # 케이스마다 묻고 전송하지 않고, 생성된 메시지를 모아 프로토콜별로 한 번에 전송한다
+        if generated_messages:
+            send_test = input(f"생성된 {len(generated_messages)}개 메시지의 전송 테스트를 수행하시겠습니까? (y/N): ").strip().lower()
+            if send_test == 'y':
+                await self.test_message_transmission(generated_messages)
     
     def show_test_history(self):
         """테스트 히스토리를 보여줍니다."""
@@ -325,6 +364,8 @@ class UITestTool:
         
         print(f"총 {len(self.test_history)}개의 테스트가 실행되었습니다.\n")
         
+        # 기록마다 print하지 않고 전체 출력을 만들어 한 번에 출력한다
+        lines = []
         for i, record in enumerate(self.test_history, 1):
             timestamp = record.get("timestamp", "Unknown")
             status = record.get("status", "Unknown")
@@ -332,19 +373,20 @@ class UITestTool:
             
             status_icon = "✅" if status == "SUCCESS" else "❌"
             
-            print(f"[{i}] {timestamp} - RFC {rfc_version} - {status_icon} {status}")
+            lines.append(f"[{i}] {timestamp} - RFC {rfc_version} - {status_icon} {status}")
             
             if "generated_message" in record:
                 msg = record["generated_message"]
-                print(f"    메시지: {msg[:60]}{'...' if len(msg) > 60 else ''}")
+                lines.append(f"    메시지: {msg[:60]}{'...' if len(msg) > 60 else ''}")
             elif "raw_message" in record:
                 msg = record["raw_message"]
-                print(f"    Raw: {msg[:60]}{'...' if len(msg) > 60 else ''}")
+                lines.append(f"    Raw: {msg[:60]}{'...' if len(msg) > 60 else ''}")
             
             if status == "FAILED" and "error" in record:
-                print(f"    오류: {record['error']}")
+                lines.append(f"    오류: {record['error']}")
             
-            print()
+            lines.append("")
+        print("\n".join(lines))
     
     def save_results_to_file(self):
         """결과를 파일로 저장합니다."""
@@ -355,8 +397,7 @@ class UITestTool:
         filename = input("저장할 파일명 (기본값: ui_test_results.json): ").strip() or "ui_test_results.json"
         
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(self.test_history, f, ensure_ascii=False, indent=2)
+            write_json(filename, self.test_history, _json_default)
             
             print(f"✅ 테스트 결과가 '{filename}' 파일에 저장되었습니다.")
             print(f"총 {len(self.test_history)}개의 테스트 결과가 저장되었습니다.")
@@ -381,6 +422,8 @@ class UITestTool:
                     save = input("종료하기 전에 테스트 결과를 저장하시겠습니까? (y/N): ").strip().lower()
                     if save == 'y':
                         self.save_results_to_file()
+                # 전송 테스트에서 재사용한 연결을 이벤트 루프가 살아 있는 동안 닫는다
+                SyslogSender.close()
                 break
                 
             elif choice == "1":
@@ -395,7 +438,7 @@ class UITestTool:
                 self.test_raw_message_parsing()
                 
             elif choice == "4":
-                self.run_predefined_tests()
+                await self.run_predefined_tests()
                 
             elif choice == "5":
                 self.show_test_history()